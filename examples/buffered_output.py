@@ -0,0 +1,47 @@
+# !/usr/bin/env python3
+"""
+==============================================================
+Description  : 示例共用的输出工具
+Author       : sandorn sandorn@live.cn
+Github       : https://github.com/sandorn/xtsqlorm
+
+本模块供需要并发运行示例的脚本使用:
+- ThreadBufferedOutput: 按线程缓冲的stdout,并发运行时各示例的输出互不交错
+==============================================================
+"""
+
+from __future__ import annotations
+
+import io
+import threading
+from collections.abc import Callable
+from typing import Any
+
+
+class ThreadBufferedOutput(io.TextIOBase):
+    """按线程缓冲的stdout: 并发运行示例时,各线程的print输出写入各自的缓冲区,互不交错
+
+    Example:
+        >>> output = ThreadBufferedOutput(sys.stdout)
+        >>> with redirect_stdout(output), ThreadPoolExecutor() as executor:
+        ...     futures = [executor.submit(output.run, example_1), executor.submit(output.run, example_2)]
+        >>> for future in futures:
+        ...     sys.stdout.write(future.result())
+    """
+
+    def __init__(self, target: io.TextIOBase | Any):
+        self._target = target
+        self._local = threading.local()
+
+    def write(self, s: str) -> int:
+        buffer = getattr(self._local, 'buffer', None)
+        return (buffer or self._target).write(s)
+
+    def run(self, func: Callable[..., Any], *args: Any) -> str:
+        """在当前线程运行func,返回其全部输出"""
+        self._local.buffer = io.StringIO()
+        try:
+            func(*args)
+            return self._local.buffer.getvalue()
+        finally:
+            self._local.buffer = None
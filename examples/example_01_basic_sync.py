@@ -27,15 +27,13 @@ def example_1_quick_start():
     """示例 1: 快速开始 - 最简单的方式"""
     print_section('示例 1: 快速开始')
 
-    from sqlalchemy import inspect
     from user import UserModel
 
     # 检查数据库中表users是否存在,不存在则创建
     conn_mgr = create_connection_manager(db_key='default')
-    inspector = inspect(conn_mgr.engine)
     table_name = 'users'
 
-    if inspector.has_table(table_name):
+    if conn_mgr.inspector.has_table(table_name):
         print(f'✅ 表 {table_name} 已存在')
     else:
         print(f'⚠️  表 {table_name} 不存在,正在创建...')
@@ -13,159 +13,198 @@
 
 from __future__ import annotations
 
-from xtsqlorm import create_connection_manager, create_repository, generate_model_file, get_or_create_table_model, reflect_table
+import hashlib
+import sys
+from collections.abc import Callable, Generator
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager, redirect_stdout
+from itertools import islice
+from typing import Any
 
+from buffered_output import ThreadBufferedOutput
+from sqlalchemy import text
 
-def print_section(title: str):
-    """打印分隔线"""
-    print(f'\n{"=" * 60}')
-    print(f'{title}')
-    print('=' * 60)
+from xtsqlorm import BaseModel, ConnectionManager, create_connection_manager, create_repository, create_session_provider, generate_model_file, get_or_create_table_model, reflect_tables
 
+# 预先构建的分隔线
+_BANNER60 = '=' * 60
+_BANNER80 = '=' * 80
 
-def example_1_reflect_table():
-    """示例 1: 反射数据库表"""
-    print_section('示例 1: 反射数据库表')
-
-    # 反射已存在的表
-    UserModel = reflect_table('users', db_key='default')
-
-    print(f'✅ 反射模型类: {UserModel.__name__}')
-    print(f'✅ 表名: {UserModel.__tablename__}')  # type: ignore[attr-defined]
-    print(f'✅ 列数: {len(UserModel.__table__.columns)}')  # type: ignore[attr-defined]
 
-    # 显示所有列
-    print('\n列信息:')
-    for column in UserModel.__table__.columns:  # type: ignore[attr-defined]
-        print(f'   - {column.name}: {column.type}')
-
-    # 使用反射的模型进行查询
-    user_repo = create_repository(UserModel, db_key='default')
-    total = user_repo.count()
-    print(f'\n✅ 使用反射模型查询: 共 {total} 条记录')
+@contextmanager
+def buffered_section(title: str) -> Generator[list[str]]:
+    """收集一个示例的输出行(以分隔线标题开头),退出时一次性写入stdout"""
+    out = [f'\n{_BANNER60}', title, _BANNER60]
+    try:
+        yield out
+    finally:
+        sys.stdout.write('\n'.join(out) + '\n')
 
 
-def example_2_get_or_create_table():
-    """示例 2: 获取或创建表模型"""
-    print_section('示例 2: 获取或创建表模型')
+def example_1_reflect_table(conn_mgr: ConnectionManager, user_model: type[BaseModel]):
+    """示例 1: 反射数据库表"""
+    with buffered_section('示例 1: 反射数据库表') as out:
+        # user_model 由 main() 中一次批量反射得到
 
-    conn_mgr = create_connection_manager(db_key='default')
+        out.append(f'✅ 反射模型类: {user_model.__name__}')
+        out.append(f'✅ 表名: {user_model.__tablename__}')  # type: ignore[attr-defined]
+        out.append(f'✅ 列数: {len(user_model.__table__.columns)}')  # type: ignore[attr-defined]
 
-    # 方式1: 仅反射(new_table_name=None)
-    print('\n【方式1: 仅反射现有表】')
-    UserModel = get_or_create_table_model(
-        source_table_name='users',
-        db_conn=conn_mgr,
-        new_table_name=None,  # 仅反射
-    )
-    print(f'✅ 反射表: {UserModel.__tablename__}')  # type: ignore[attr-defined]
-
-    # 方式2: 复制表结构(实际执行示例)
-    print('\n【方式2: 复制表结构到临时表】')
-    try:
-        # 创建一个临时表用于演示
-        temp_table_name = 'users_temp_copy'
+        # 显示所有列
+        out.append('\n列信息:')
+        for column in user_model.__table__.columns:  # type: ignore[attr-defined]
+            out.append(f'   - {column.name}: {column.type}')
 
-        # 先删除如果存在
-        from sqlalchemy import inspect, text
+        # 使用反射的模型进行查询
+        user_repo = create_repository(user_model, session_provider=create_session_provider(conn_mgr))
+        total = user_repo.count()
+        out.append(f'\n✅ 使用反射模型查询: 共 {total} 条记录')
 
-        inspector = inspect(conn_mgr.engine)
-        if inspector.has_table(temp_table_name):
-            with conn_mgr.engine.connect() as connection:
-                connection.execute(text(f'DROP TABLE IF EXISTS {temp_table_name}'))
-                connection.commit()
-            print(f'   已删除旧的临时表: {temp_table_name}')
 
-        # 复制表结构
-        NewUserModel = get_or_create_table_model(
+def example_2_get_or_create_table(conn_mgr: ConnectionManager):
+    """示例 2: 获取或创建表模型"""
+    with buffered_section('示例 2: 获取或创建表模型') as out:
+        # 方式1: 仅反射(new_table_name=None)
+        out.append('\n【方式1: 仅反射现有表】')
+        UserModel = get_or_create_table_model(
             source_table_name='users',
             db_conn=conn_mgr,
-            new_table_name=temp_table_name,
+            new_table_name=None,  # 仅反射
         )
-        print(f'✅ 复制表结构成功: {NewUserModel.__tablename__}')  # type: ignore[attr-defined]
+        out.append(f'✅ 反射表: {UserModel.__tablename__}')  # type: ignore[attr-defined]
+
+        # 方式2: 复制表结构(实际执行示例)
+        out.append('\n【方式2: 复制表结构到临时表】')
+        try:
+            # 创建一个临时表用于演示
+            temp_table_name = 'users_temp_copy'
+
+            # 复制表结构(get_or_create_table_model 会先执行 DROP TABLE IF EXISTS,无需预先检查)
+            NewUserModel = get_or_create_table_model(
+                source_table_name='users',
+                db_conn=conn_mgr,
+                new_table_name=temp_table_name,
+            )
+            out.append(f'✅ 复制表结构成功: {NewUserModel.__tablename__}')  # type: ignore[attr-defined]
+
+            # 清理临时表
+            with conn_mgr.engine.begin() as connection:
+                connection.execute(text(f'DROP TABLE IF EXISTS {temp_table_name}'))
+            out.append(f'   已清理临时表: {temp_table_name}')
 
-        # 清理临时表
-        with conn_mgr.engine.connect() as connection:
-            connection.execute(text(f'DROP TABLE IF EXISTS {temp_table_name}'))
-            connection.commit()
-        print(f'   已清理临时表: {temp_table_name}')
+        except Exception as e:
+            out.append(f'⚠️  复制表结构失败(可能表不存在): {e}')
 
-    except Exception as e:
-        print(f'⚠️  复制表结构失败(可能表不存在): {e}')
 
-    conn_mgr.dispose()
+def _schema_hash(model: type[BaseModel]) -> str:
+    """根据列名和列类型计算表结构签名"""
+    columns = sorted((column.name, str(column.type)) for column in model.__table__.columns)  # type: ignore[attr-defined]
+    return hashlib.blake2b(repr(columns).encode(), digest_size=8).hexdigest()
 
 
-def example_3_generate_model_file():
+def example_3_generate_model_file(user_model: type[BaseModel]):
     """示例 3: 生成模型文件"""
-    print_section('示例 3: 生成模型文件')
-
-    # 实际执行(可选)
-    try:
-        output_file = 'examples/generated_models.py'
-        generate_model_file(
-            'users',  # tablename 必需参数
-            db_key='default',
-            output_file=output_file,
-        )
-        print(f'\n✅ 模型文件已生成: {output_file}')
-
-        # 读取并显示生成的文件内容(前20行)
-        with open(output_file) as f:
-            lines = f.readlines()[:20]
-            print('\n生成的模型文件预览(前20行):')
-            print(''.join(lines))
-
-    except Exception as e:
-        print(f'⚠️  生成模型文件失败: {e}')
-
-
-def example_4_table_metadata():
+    with buffered_section('示例 3: 生成模型文件') as out:
+        # 实际执行(可选)
+        try:
+            output_file = 'examples/generated_models.py'
+
+            # 文件首行记录表结构签名,结构未变化时跳过重新生成
+            header = f'# schema-hash: {_schema_hash(user_model)}\n'
+            try:
+                with open(output_file, encoding='utf-8') as f:
+                    up_to_date = f.readline() == header
+            except FileNotFoundError:
+                up_to_date = False
+
+            if up_to_date:
+                out.append(f'\n✅ 模型文件已是最新,跳过生成: {output_file}')
+            else:
+                returncode = generate_model_file(
+                    'users',  # tablename 必需参数
+                    db_key='default',
+                    output_file=output_file,
+                )
+                if returncode != 0:
+                    out.append(f'\n❌ 生成模型文件失败,返回码: {returncode}')
+                    return
+                with open(output_file, encoding='utf-8') as f:
+                    content = f.read()
+                with open(output_file, 'w', encoding='utf-8') as f:
+                    f.write(header + content)
+                out.append(f'\n✅ 模型文件已生成: {output_file}')
+
+            # 读取并显示生成的文件内容(前20行)
+            with open(output_file, encoding='utf-8') as f:
+                lines = list(islice(f, 20))
+                out.append('\n生成的模型文件预览(前20行):')
+                out.append(''.join(lines))
+
+        except Exception as e:
+            out.append(f'⚠️  生成模型文件失败: {e}')
+
+
+def example_4_table_metadata(user_model: type[BaseModel]):
     """示例 4: 探索表元数据"""
-    print_section('示例 4: 探索表元数据')
-
-    UserModel = reflect_table('users', db_key='default')
+    with buffered_section('示例 4: 探索表元数据') as out:
+        table = user_model.__table__  # type: ignore[attr-defined]
+        indexes = table.indexes
+        constraints = table.constraints
 
-    print('表的详细元数据:')
+        out.append('表的详细元数据:')
 
-    # 主键
-    print(f'\n主键: {UserModel.__table__.primary_key.columns.keys()}')  # type: ignore[attr-defined]
+        # 主键
+        out.append(f'\n主键: {table.primary_key.columns.keys()}')
 
-    # 外键
-    print(f'外键: {[fk.target_fullname for fk in UserModel.__table__.foreign_keys]}')  # type: ignore[attr-defined]
+        # 外键
+        out.append(f'外键: {[fk.target_fullname for fk in table.foreign_keys]}')
 
-    # 索引
-    print(f'\n索引数量: {len(UserModel.__table__.indexes)}')  # type: ignore[attr-defined]
-    for idx in UserModel.__table__.indexes:  # type: ignore[attr-defined]
-        print(f'   - {idx.name}: {[col.name for col in idx.columns]}')
+        # 索引
+        out.append(f'\n索引数量: {len(indexes)}')
+        for idx in indexes:
+            out.append(f'   - {idx.name}: {[col.name for col in idx.columns]}')
 
-    # 约束
-    print(f'\n约束数量: {len(UserModel.__table__.constraints)}')  # type: ignore[attr-defined]
-    for constraint in UserModel.__table__.constraints:  # type: ignore[attr-defined]
-        print(f'   - {type(constraint).__name__}: {constraint.name}')
+        # 约束
+        out.append(f'\n约束数量: {len(constraints)}')
+        for constraint in constraints:
+            out.append(f'   - {type(constraint).__name__}: {constraint.name}')
 
-    # 列详情
-    print('\n列详细信息:')
-    for column in UserModel.__table__.columns:  # type: ignore[attr-defined]
-        nullable = '可空' if column.nullable else '非空'
-        default = f', 默认值: {column.default}' if column.default else ''
-        print(f'   - {column.name}: {column.type} ({nullable}{default})')
+        # 列详情
+        out.append('\n列详细信息:')
+        for column in table.columns:
+            nullable = '可空' if column.nullable else '非空'
+            column_default = column.default
+            default = f', 默认值: {column_default}' if column_default else ''
+            out.append(f'   - {column.name}: {column.type} ({nullable}{default})')
 
 
 def main():
     """主函数"""
-    print('=' * 80)
-    print('xtsqlorm 表反射和动态模型示例')
-    print('=' * 80)
-
-    example_1_reflect_table()
-    example_2_get_or_create_table()
-    example_3_generate_model_file()
-    example_4_table_metadata()
-
-    print('\n' + '=' * 80)
-    print('🎉 所有示例运行完成!')
-    print('=' * 80)
+    sys.stdout.write(f'{_BANNER80}\nxtsqlorm 表反射和动态模型示例\n{_BANNER80}\n')
+
+    # 所有示例共用一个连接管理器(一个引擎和连接池)
+    conn_mgr = create_connection_manager(db_key='default')
+    try:
+        # 一次性批量反射示例所需的表(结果保存在BaseModel.metadata中,后续反射直接复用)
+        models = reflect_tables(['users'], conn_mgr)
+
+        # 只读示例以数据库I/O为主,使用线程池并发运行,输出按示例顺序依次打印
+        output = ThreadBufferedOutput(sys.stdout)
+        with redirect_stdout(output), ThreadPoolExecutor(max_workers=3) as executor:
+            futures = [
+                executor.submit(output.run, example_1_reflect_table, conn_mgr, models['users']),
+                executor.submit(output.run, example_3_generate_model_file, models['users']),
+                executor.submit(output.run, example_4_table_metadata, models['users']),
+            ]
+        for future in futures:
+            sys.stdout.write(future.result())
+
+        # 示例2会执行DROP/CREATE、修改共享的BaseModel.metadata并清除inspector缓存,在并发示例结束后串行运行
+        example_2_get_or_create_table(conn_mgr)
+    finally:
+        conn_mgr.dispose()
+
+    sys.stdout.write(f'\n{_BANNER80}\n🎉 所有示例运行完成!\n{_BANNER80}\n')
 
 
 if __name__ == '__main__':
@@ -12,19 +12,25 @@
 
 from __future__ import annotations
 
+import sys
 from datetime import datetime
 
 from sqlalchemy import Column, Enum, Integer, String
 
 from xtsqlorm import Base, BaseModel, EnumType, IdMixin, JsonEncodedDict, SoftDeleteMixin, TimestampMixin, UTCDateTime, UTCTimeMixin, VersionedMixin, create_repository
 
+# 预先构建的分隔线
+_BANNER60 = '=' * 60
+_BANNER80 = '=' * 80
+
 
 def print_section(title: str):
     """打印分隔线"""
-    print(f'\n{"=" * 60}')
-    print(f'{title}')
-    print('=' * 60)
+    sys.stdout.write(f'\n{_BANNER60}\n{title}\n{_BANNER60}\n')
+
 
+# ConfigModel.category 允许的取值
+_VALID_CATEGORIES = frozenset({'system', 'user', 'app'})
 
 # ============ 定义演示类(不使用SQLAlchemy,仅演示Mixin功能)============
 
@@ -34,14 +40,18 @@ def print_section(title: str):
 class DemoArticle:
     """演示文章类 - 手动模拟 Mixin 功能"""
 
+    __slots__ = ('content', 'created_at', 'deleted_at', 'id', 'title', 'updated_at', 'version')
+
     def __init__(self, title: str, content: str):
         self.title = title
         self.content = content
         self.id = None
         self.version = 0
         self.deleted_at = None
-        self.created_at = datetime.now()
-        self.updated_at = datetime.now()
+        # 只读取一次时钟,保证两个时间戳一致
+        now = datetime.now()
+        self.created_at = now
+        self.updated_at = now
 
     @property
     def is_deleted(self) -> bool:
@@ -60,12 +70,29 @@ class DemoArticle:
 class DemoConfig:
     """演示配置类 - 手动模拟类型功能"""
 
-    def __init__(self, key: str, value: str | None = None, **kwargs):
+    __slots__ = ('category', 'expires_at', 'key', 'metadata_json', 'value')
+
+    def __init__(
+        self,
+        key: str,
+        value: str | None = None,
+        *,
+        metadata_json: dict | None = None,
+        expires_at: datetime | None = None,
+        category: str | None = None,
+    ):
+        if category is not None and category not in _VALID_CATEGORIES:
+            raise ValueError(f'无效的 category: {category!r},允许的值: {sorted(_VALID_CATEGORIES)}')
         self.key = key
         self.value = value
-        self.metadata_json = kwargs.get('metadata_json')
-        self.expires_at = kwargs.get('expires_at')
-        self.category = kwargs.get('category')
+        self.metadata_json = metadata_json
+        self.expires_at = expires_at
+        self.category = category
+
+
+# 字段声明在 __slots__ 中,导入时确定一次即可
+_HAS_CREATED_AT = 'created_at' in DemoArticle.__slots__
+_HAS_UPDATED_AT = 'updated_at' in DemoArticle.__slots__
 
 
 # ============ 示例函数 ============
@@ -93,8 +120,8 @@ def example_2_timestamp_mixin():
     print('   - updated_at: 更新时间(自动更新)')
     print('')
     print('DemoArticle 模拟了 TimestampMixin:')
-    print(f'   - 有 created_at 字段: {hasattr(DemoArticle, "created_at")}')
-    print(f'   - 有 updated_at 字段: {hasattr(DemoArticle, "updated_at")}')
+    print(f'   - 有 created_at 字段: {_HAS_CREATED_AT}')
+    print(f'   - 有 updated_at 字段: {_HAS_UPDATED_AT}')
 
 
 def example_3_soft_delete_mixin():
@@ -135,6 +162,7 @@ def example_4_versioned_mixin():
     print('VersionedMixin 提供:')
     print('   - version: 版本号(每次更新自增)')
     print('   - increment_version(): 增加版本号')
+    print('   - bulk_increment_version(session, ids): 单条 UPDATE 批量增加版本号')
     print('')
     print('用于乐观锁实现,防止并发更新冲突')
     print('')
@@ -240,7 +268,12 @@ def example_8_enum_type():
     config3 = DemoConfig(key='app_config', value='test', category='app')
     print(f'✅ 创建配置3: category={config3.category} (有效值)')
 
-    print('\n说明: 如果使用无效值(如 "invalid"),在数据库插入时会报错')
+    try:
+        DemoConfig(key='bad_config', value='test', category='invalid')
+    except ValueError as e:
+        print(f'❌ 无效值被拒绝: {e}')
+
+    print('\n说明: DemoConfig 在创建时校验 category;EnumType 在写入数据库前校验,无效值会抛出 ValueError')
 
 
 def example_9_combined_usage():
@@ -289,9 +322,7 @@ def example_9_combined_usage():
 
 def main():
     """主函数"""
-    print('=' * 80)
-    print('xtsqlorm Mixin 和自定义类型示例')
-    print('=' * 80)
+    sys.stdout.write(f'{_BANNER80}\nxtsqlorm Mixin 和自定义类型示例\n{_BANNER80}\n')
 
     example_1_id_mixin()
     example_2_timestamp_mixin()
@@ -303,9 +334,7 @@ def main():
     example_8_enum_type()
     example_9_combined_usage()
 
-    print('\n' + '=' * 80)
-    print('🎉 所有示例运行完成!')
-    print('=' * 80)
+    sys.stdout.write(f'\n{_BANNER80}\n🎉 所有示例运行完成!\n{_BANNER80}\n')
 
 
 if __name__ == '__main__':
@@ -11,13 +11,17 @@
 4. 使用高级验证器 (type, choices, chinese_id_card)
 5. OrmOperations 的验证功能
 6. 实际应用场景示例
+
+性能说明: 本示例的验证逻辑以CPU为主(正则匹配、字符串扫描),
+优化重点在预编译正则和减少逐字符的Python循环。
 """
 
 from __future__ import annotations
 
+import time
 from datetime import datetime
 
-from pydantic import BaseModel as PydanticModel, Field, field_validator
+from pydantic import BaseModel as PydanticModel, ConfigDict, EmailStr, Field, ValidationError as PydanticValidationError, field_validator
 
 from xtsqlorm import (
     ValidationError,
@@ -27,6 +31,7 @@ from xtsqlorm import (
     validate_email,
     validate_in_choices,
     validate_ip,
+    validate_ips,
     validate_length,
     validate_password_strength,
     validate_pattern,
@@ -50,46 +55,34 @@ def print_section(title: str):
 
 
 class UserValidator(PydanticModel):
-    """用户数据验证模型"""
+    """用户数据验证模型
+
+    长度、范围、邮箱和手机号格式均以字段约束声明,由 pydantic-core(Rust)直接校验
+    """
+
+    model_config = ConfigDict(regex_engine='rust-regex')
 
     username: str = Field(..., min_length=3, max_length=50)
-    email: str
+    email: EmailStr
     password: str = Field(..., min_length=6)
-    phone: str | None = None
+    phone: str | None = Field(None, pattern=r'^\d{11}$')
     age: int | None = Field(None, ge=0, le=150)
 
-    @field_validator('email')
-    @classmethod
-    def validate_email_format(cls, v):
-        """验证邮箱格式"""
-        import re
-
-        if not v:
-            raise ValueError('邮箱不能为空')
-        pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-        if not re.match(pattern, v):
-            raise ValueError('邮箱格式无效')
-        return v
-
-    @field_validator('phone')
-    @classmethod
-    def validate_phone_number(cls, v):
-        """验证手机号"""
-        if v and not v.isdigit():
-            raise ValueError('手机号必须是数字')
-        if v and len(v) != 11:
-            raise ValueError('手机号必须是11位')
-        return v
-
     @field_validator('password')
     @classmethod
     def validate_password_strength(cls, v):
-        """验证密码强度"""
-        if not any(c.isdigit() for c in v):
+        """验证密码强度(单次遍历,数字和字母都出现后提前结束)"""
+        has_digit = has_alpha = False
+        for c in v:
+            if c.isdigit():
+                has_digit = True
+            elif c.isalpha():
+                has_alpha = True
+            if has_digit and has_alpha:
+                return v
+        if not has_digit:
             raise ValueError('密码必须包含至少一个数字')
-        if not any(c.isalpha() for c in v):
-            raise ValueError('密码必须包含至少一个字母')
-        return v
+        raise ValueError('密码必须包含至少一个字母')
 
 
 # ============ 示例函数 ============
@@ -155,8 +148,6 @@ def example_2_orm_with_validation():
     # 测试有效数据
     print('【测试有效数据】')
     try:
-        import time
-
         timestamp = int(time.time())
 
         valid_user = ops.create({
@@ -275,31 +266,11 @@ def example_4_custom_validation():
     print_section('示例 4: 自定义验证逻辑')
 
     def validate_user_data(data: dict) -> dict:
-        """自定义用户数据验证"""
-        errors = []
-
-        # 用户名验证
-        if 'username' not in data:
-            errors.append('缺少用户名')
-        elif len(data['username']) < 3:
-            errors.append('用户名至少3个字符')
-
-        # 邮箱验证
-        if 'email' not in data:
-            errors.append('缺少邮箱')
-        elif '@' not in data['email']:
-            errors.append('邮箱格式错误')
-
-        # 密码验证
-        if 'password' not in data:
-            errors.append('缺少密码')
-        elif len(data['password']) < 6:
-            errors.append('密码至少6个字符')
-
-        if errors:
-            raise ValidationError('; '.join(errors))
-
-        return data
+        """自定义用户数据验证(校验在 pydantic-core 中一次完成,错误统一汇总)"""
+        try:
+            return UserValidator.model_validate(data).model_dump(exclude_unset=True)
+        except PydanticValidationError as e:
+            raise ValidationError('; '.join(f'{".".join(map(str, err["loc"]))}: {err["msg"]}' for err in e.errors())) from e
 
     # 测试自定义验证
     print('测试自定义验证函数:\n')
@@ -478,30 +449,23 @@ def example_8_real_world_scenarios():
     def validate_registration_form(data: dict) -> dict:
         """验证用户注册表单"""
         errors = []
-
-        try:
-            validate_required(data.get('username'), 'username')
-            validate_username(data['username'], min_length=4, max_length=20)
-        except ValidationError as e:
-            errors.append(f'用户名: {e.message}')
-
-        try:
-            validate_required(data.get('email'), 'email')
-            validate_email(data['email'])
-        except ValidationError as e:
-            errors.append(f'邮箱: {e.message}')
-
-        try:
-            validate_required(data.get('password'), 'password')
-            validate_password_strength(data['password'], min_length=8, require_upper=True, require_digit=True)
-        except ValidationError as e:
-            errors.append(f'密码: {e.message}')
-
-        if data.get('phone'):
+        # (标签, 值, 验证函数, 参数, 是否必填): 必填检查直接判断,不经过异常
+        checks = (
+            ('用户名', data.get('username'), validate_username, {'min_length': 4, 'max_length': 20}, True),
+            ('邮箱', data.get('email'), validate_email, {}, True),
+            ('密码', data.get('password'), validate_password_strength, {'min_length': 8, 'require_upper': True, 'require_digit': True}, True),
+            ('手机号', data.get('phone'), validate_phone, {}, False),
+        )
+
+        for label, value, validator, kwargs, required in checks:
+            if value is None or value == '':
+                if required:
+                    errors.append(f'{label}: 该字段为必填项')
+                continue
             try:
-                validate_phone(data['phone'])
+                validator(value, **kwargs)
             except ValidationError as e:
-                errors.append(f'手机号: {e.message}')
+                errors.append(f'{label}: {e.message}')
 
         if errors:
             raise ValidationError('; '.join(errors))
@@ -535,23 +499,26 @@ def example_8_real_world_scenarios():
     # 场景2: API请求参数验证
     print('\n【场景2: API请求参数验证】')
 
+    # 区分"键不存在"和"值为None": 存在但为None的参数同样要经过验证
+    missing = object()
+
     def validate_api_request(data: dict) -> dict:
         """验证API请求参数"""
         # 验证必需参数
-        validate_required(data.get('action'), 'action')
-        validate_in_choices(data['action'], ['create', 'update', 'delete'], 'action')
+        action = data.get('action')
+        validate_required(action, 'action')
+        validate_in_choices(action, ('create', 'update', 'delete'), 'action')
 
         # 验证可选参数
-        if 'callback_url' in data:
-            validate_url(data['callback_url'], require_https=True)
+        if (callback_url := data.get('callback_url', missing)) is not missing:
+            validate_url(callback_url, require_https=True)
 
-        if 'timeout' in data:
-            validate_type(data['timeout'], (int, float), 'timeout')
-            validate_range(data['timeout'], min_val=1, max_val=300, field='timeout')
+        if (timeout := data.get('timeout', missing)) is not missing:
+            validate_type(timeout, (int, float), 'timeout')
+            validate_range(timeout, min_val=1, max_val=300, field='timeout')
 
-        if 'ip_whitelist' in data:
-            for ip in data['ip_whitelist']:
-                validate_ip(ip, version=4)
+        if (ip_whitelist := data.get('ip_whitelist', missing)) is not missing:
+            validate_ips(ip_whitelist, 'ip_whitelist', version=4)
 
         return data
 
@@ -584,16 +551,14 @@ def example_8_real_world_scenarios():
     def validate_config(config: dict) -> dict:
         """验证配置文件"""
         # 数据库配置
-        if 'database' in config:
-            db_config = config['database']
+        if (db_config := config.get('database', missing)) is not missing:
             validate_required(db_config.get('host'), 'database.host')
             validate_range(db_config.get('port', 3306), min_val=1, max_val=65535, field='database.port')
             validate_type(db_config.get('timeout', 30), (int, float), 'database.timeout')
 
         # 日志配置
-        if 'logging' in config:
-            log_config = config['logging']
-            validate_in_choices(log_config.get('level', 'INFO'), ['DEBUG', 'INFO', 'WARNING', 'ERROR'], 'logging.level')
+        if (log_config := config.get('logging', missing)) is not missing:
+            validate_in_choices(log_config.get('level', 'INFO'), ('DEBUG', 'INFO', 'WARNING', 'ERROR'), 'logging.level')
 
         return config
 
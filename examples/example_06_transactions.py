@@ -9,13 +9,23 @@
 2. 工作单元模式 (UnitOfWork)
 3. 复杂事务场景
 4. 事务回滚
+
+性能说明: 本示例以数据库I/O为主(网络往返、COMMIT落盘),
+优化重点在合并语句与事务、复用连接池,而非Python层的CPU微优化。
 """
 
 from __future__ import annotations
 
-from sqlalchemy import text
+import time
+from functools import cache
+
+from sqlalchemy import func, select
+from user import UserModel, UserProfileModel
+
+from xtsqlorm import SessionProvider, UnitOfWork, create_repository, create_session_provider
 
-from xtsqlorm import UnitOfWork, create_repository, create_session_provider
+# 用户计数语句,模块级构建一次供各示例复用
+_COUNT_USERS = select(func.count()).select_from(UserModel)
 
 
 def print_section(title: str):
@@ -25,13 +35,17 @@ def print_section(title: str):
     print('=' * 60)
 
 
+@cache
+def _get_provider(db_key: str = 'default') -> SessionProvider:
+    """按 db_key 缓存会话提供者,所有示例共享同一个连接池"""
+    return create_session_provider(db_key=db_key)
+
+
 def example_1_simple_transaction():
     """示例 1: 简单事务"""
     print_section('示例 1: 简单事务管理')
 
-    from user import UserModel
-
-    session_provider = create_session_provider(db_key='default')
+    session_provider = _get_provider('default')
 
     print('使用 transaction() 上下文管理器:')
     print('   - 自动开始事务')
@@ -44,8 +58,7 @@ def example_1_simple_transaction():
         print('✅ 事务已开始')
 
         # 在事务中执行操作
-        result = session.execute(text('SELECT COUNT(*) FROM users'))
-        count = result.scalar()
+        count = session.execute(_COUNT_USERS).scalar_one()
         print(f'✅ 查询到 {count} 个用户')
 
         # 事务会在退出 with 块时自动提交
@@ -56,9 +69,7 @@ def example_2_transaction_rollback():
     """示例 2: 事务回滚"""
     print_section('示例 2: 事务回滚')
 
-    from user import UserModel
-
-    session_provider = create_session_provider(db_key='default')
+    session_provider = _get_provider('default')
     create_repository(UserModel, session_provider=session_provider)
 
     print('当发生异常时,事务会自动回滚:\n')
@@ -68,8 +79,8 @@ def example_2_transaction_rollback():
             print('✅ 事务已开始')
 
             # 执行一些操作 - 直接使用 session 查询
-            users = session.query(UserModel).limit(1).all()
-            print(f'✅ 查询到 {len(users)} 个用户')
+            user = session.scalars(select(UserModel).limit(1)).first()
+            print(f'✅ 查询到 {1 if user else 0} 个用户')
 
             # 模拟异常
             print('⚠️  模拟发生异常...')
@@ -84,9 +95,7 @@ def example_3_unit_of_work():
     """示例 3: 工作单元模式"""
     print_section('示例 3: 工作单元模式 (UnitOfWork)')
 
-    from user import UserModel
-
-    session_provider = create_session_provider(db_key='default')
+    session_provider = _get_provider('default')
 
     print('工作单元的优势:')
     print('   - 统一管理多个仓储')
@@ -104,7 +113,7 @@ def example_3_unit_of_work():
         print('✅ 已创建 users 仓储')
 
         # 在同一事务中执行操作 - 使用 uow.session
-        total_users = uow.session.query(UserModel).count()
+        total_users = uow.session.execute(_COUNT_USERS).scalar_one()
         print(f'✅ 用户总数: {total_users}')
 
         # 工作单元会在退出 with 块时自动提交
@@ -115,9 +124,7 @@ def example_4_complex_transaction():
     """示例 4: 复杂事务场景"""
     print_section('示例 4: 复杂事务场景')
 
-    from user import UserModel, UserProfileModel
-
-    session_provider = create_session_provider(db_key='default')
+    session_provider = _get_provider('default')
     user_repo = create_repository(UserModel, session_provider=session_provider)
     profile_repo = create_repository(UserProfileModel, session_provider=session_provider)
 
@@ -125,8 +132,6 @@ def example_4_complex_transaction():
     print('【实际执行示例】')
 
     try:
-        import time
-
         timestamp = int(time.time())
 
         with session_provider.transaction() as session:
@@ -156,9 +161,10 @@ def example_4_complex_transaction():
             # 事务自动提交
         print('✅ 事务提交成功: 用户和资料都已创建')
 
-        # 清理测试数据
-        user_repo.delete(user.id)  # type: ignore[attr-defined]
-        profile_repo.delete(profile.id)  # type: ignore[attr-defined]
+        # 清理测试数据(同一事务内删除,先删资料再删用户)
+        with session_provider.transaction() as session:
+            profile_repo.delete_in_session(profile.id, session)  # type: ignore[attr-defined]
+            user_repo.delete_in_session(user.id, session)  # type: ignore[attr-defined]
         print('   已清理测试数据')
 
     except Exception as e:
@@ -199,9 +205,7 @@ def example_6_manual_transaction():
     """示例 6: 手动事务控制"""
     print_section('示例 6: 手动事务控制(不推荐)')
 
-    from user import UserModel
-
-    create_session_provider(db_key='default')
+    _get_provider('default')
 
     print('虽然可以手动控制事务,但不推荐:')
     print('')
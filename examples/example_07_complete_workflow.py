@@ -15,18 +15,27 @@
 from __future__ import annotations
 
 import hashlib
+import hmac
+import os
+import sys
 from datetime import datetime
 
-from pydantic import BaseModel as PydanticModel, EmailStr, Field
+from pydantic import BaseModel as PydanticModel, EmailStr, Field, model_validator
+from sqlalchemy import case, func
 
 from xtsqlorm import UnitOfWork, create_orm_operations, create_session_provider
 
+_BANNER60 = '=' * 60
+
+# PBKDF2 迭代次数
+_PBKDF2_ITERATIONS = 200_000
+# 用户不存在时参与验证的占位哈希('盐值$派生密钥'),保证执行同等的KDF计算
+_DUMMY_PASSWORD_HASH = f'{"00" * 16}${"00" * 32}'
+
 
 def print_section(title: str):
     """打印分隔线"""
-    print(f'\n{"=" * 60}')
-    print(f'{title}')
-    print('=' * 60)
+    sys.stdout.write(f'\n{_BANNER60}\n{title}\n{_BANNER60}\n')
 
 
 # ============ Pydantic 验证模型 ============
@@ -40,6 +49,14 @@ class UserRegisterSchema(PydanticModel):
     password: str = Field(..., min_length=6)
     phone: str | None = None
     nickname: str | None = None
+    # 验证通过后计算一次的密码哈希('盐值$派生密钥'),不参与序列化
+    password_hash: str | None = Field(None, exclude=True)
+
+    @model_validator(mode='after')
+    def _hash_password(self) -> UserRegisterSchema:
+        """验证通过后立即计算密码哈希,后续直接读取 password_hash"""
+        self.password_hash = '$'.join(UserService.hash_password(self.password))
+        return self
 
 
 class UserLoginSchema(PydanticModel):
@@ -75,9 +92,51 @@ class UserService:
         )
 
     @staticmethod
-    def hash_password(password: str) -> str:
-        """密码哈希"""
-        return hashlib.sha256(password.encode()).hexdigest()
+    def hash_password(password: str, salt: bytes | None = None) -> tuple[str, str]:
+        """密码哈希(PBKDF2-HMAC-SHA256,每个用户独立盐值)
+
+        Args:
+            password: 明文密码
+            salt: 盐值,为None时随机生成16字节
+
+        Returns:
+            tuple[str, str]: (盐值hex, 派生密钥hex)
+        """
+        if salt is None:
+            salt = os.urandom(16)
+        derived = hashlib.pbkdf2_hmac('sha256', password.encode('utf-8'), salt, _PBKDF2_ITERATIONS, dklen=32)
+        return salt.hex(), derived.hex()
+
+    @staticmethod
+    def fingerprint(data: bytes) -> str:
+        """计算非密码类数据的摘要(幂等键、缓存键等)
+
+        Args:
+            data: 原始字节数据
+
+        Returns:
+            str: 16字节BLAKE2b摘要的hex字符串
+        """
+        return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+    @classmethod
+    def verify_password(cls, password: str, stored: str) -> bool:
+        """验证密码(常量时间比较)
+
+        Args:
+            password: 明文密码
+            stored: 存储的 '盐值hex$派生密钥hex'
+
+        Returns:
+            bool: 密码是否匹配
+        """
+        salt_hex, _, derived_hex = stored.partition('$')
+        try:
+            salt = bytes.fromhex(salt_hex)
+        except ValueError:
+            return False
+        _, expected = cls.hash_password(password, salt)
+        return hmac.compare_digest(expected, derived_hex)
 
     def register(self, data: UserRegisterSchema) -> dict:
         """用户注册
@@ -90,25 +149,25 @@ class UserService:
         """
         print('\n【用户注册】')
 
-        # 检查用户名是否已存在
-        existing_user = self.user_ops.get_one({'username': data.username})
-        if existing_user:
+        # 一次查询同时检查用户名和邮箱是否已存在
+        existing, matched = self.user_ops.get_one_matching_any({'username': data.username, 'email': data.email})
+        if existing is not None:
+            if 'email' in matched and 'username' not in matched:
+                raise ValueError(f'邮箱 {data.email} 已被注册')
             raise ValueError(f'用户名 {data.username} 已存在')
 
-        # 检查邮箱是否已存在
-        existing_email = self.user_ops.get_one({'email': data.email})
-        if existing_email:
-            raise ValueError(f'邮箱 {data.email} 已被注册')
-
         # 创建用户(实际执行)
         print(f'准备创建用户: {data.username}')
         print(f'   - 邮箱: {data.email}')
         print(f'   - 昵称: {data.nickname or data.username}')
 
+        # 注册请求的幂等键(不含密码)
+        idempotency_key = self.fingerprint(data.model_dump_json(exclude={'password'}).encode())
+
         user_data = {
             'username': data.username,
             'email': data.email,
-            'password': self.hash_password(data.password),
+            'password': data.password_hash,
             'phone': data.phone,
             'nickname': data.nickname or data.username,
             'is_active': True,
@@ -119,6 +178,7 @@ class UserService:
             'id': user.id,  # type: ignore[attr-defined]
             'username': data.username,
             'email': data.email,
+            'idempotency_key': idempotency_key,
             'message': '注册成功',
         }
 
@@ -136,11 +196,13 @@ class UserService:
         # 查找用户
         user = self.user_ops.get_one({'username': data.username})
         if not user:
+            # 用户不存在时仍执行一次KDF,使响应时间与密码错误一致,防止通过耗时枚举用户名
+            self.verify_password(data.password, _DUMMY_PASSWORD_HASH)
             raise ValueError('用户名或密码错误')
 
-        # 验证密码(示例)
-        # if user.password != self.hash_password(data.password):
-        #     raise ValueError('用户名或密码错误')
+        # 验证密码
+        if not self.verify_password(data.password, user.password):  # type: ignore[attr-defined]
+            raise ValueError('用户名或密码错误')
 
         # 检查用户状态
         if not user.is_active:  # type: ignore[attr-defined]
@@ -173,10 +235,10 @@ class UserService:
         if not user:
             raise ValueError('用户不存在')
 
-        # 准备更新数据
-        update_data = data.dict(exclude_unset=True)
-        if not update_data:
+        # 准备更新数据(未设置任何字段时无需序列化)
+        if not data.model_fields_set:
             raise ValueError('没有需要更新的数据')
+        update_data = data.model_dump(exclude_unset=True)
 
         print(f'准备更新用户 {user.username}:')  # type: ignore[attr-defined]
         for key, value in update_data.items():
@@ -202,8 +264,9 @@ class UserService:
         """
         print('\n【获取用户列表】')
 
-        # 分页查询
-        users, total = self.user_ops.get_paginated(
+        # 分页查询(只取列表需要的列,不构造ORM对象)
+        users, total = self.user_ops.get_paginated_columns(
+            ['id', 'username', 'email', 'nickname'],
             page=page,
             page_size=page_size,
             where_dict={'is_active': True},
@@ -216,15 +279,7 @@ class UserService:
         print(f'当前页记录数: {len(users)}')
 
         return {
-            'data': [
-                {
-                    'id': user.id,  # type: ignore[attr-defined]
-                    'username': user.username,  # type: ignore[attr-defined]
-                    'email': user.email,  # type: ignore[attr-defined]
-                    'nickname': user.nickname,  # type: ignore[attr-defined]
-                }
-                for user in users
-            ],
+            'data': users,
             'total': total,
             'page': page,
             'page_size': page_size,
@@ -238,26 +293,26 @@ class UserService:
         """
         print('\n【用户统计】')
 
-        # 总用户数
-        total_users = self.user_ops.count()
-
-        # 活跃用户数
-        active_users = len(self.user_ops.get_all())  # 简化示例
+        from user import UserModel
 
-        # 登录次数统计
-        try:
-            login_stats = self.user_ops.get_field_stats('login_count')
-        except Exception:
-            login_stats = {'avg': 0, 'max': 0, 'min': 0}
+        # 总用户数、活跃用户数、平均登录次数: 一条聚合查询完成
+        stats = self.user_ops.aggregate({
+            'total_users': func.count(),
+            'active_users': func.count(case((UserModel.is_active.is_(True), 1))),
+            'avg_login_count': func.avg(UserModel.login_count),
+        })
+        total_users = stats['total_users']
+        active_users = stats['active_users']
+        avg_login_count = float(stats['avg_login_count'] or 0)
 
         print(f'总用户数: {total_users}')
         print(f'活跃用户数: {active_users}')
-        print(f'平均登录次数: {login_stats["avg"]:.2f}')
+        print(f'平均登录次数: {avg_login_count:.2f}')
 
         return {
             'total_users': total_users,
             'active_users': active_users,
-            'avg_login_count': login_stats['avg'],
+            'avg_login_count': avg_login_count,
         }
 
 
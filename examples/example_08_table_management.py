@@ -14,64 +14,96 @@
 
 from __future__ import annotations
 
-from sqlalchemy import Column, Integer, String, inspect, text
+import sys
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import redirect_stdout
+from typing import Any
 
-from xtsqlorm import Base, BaseModel, IdMixin, TimestampMixin, create_connection_manager
+from buffered_output import ThreadBufferedOutput
+from sqlalchemy import Column, Integer, String, text
+
+from xtsqlorm import Base, BaseModel, ConnectionManager, IdMixin, TimestampMixin, create_connection_manager, create_repository, create_session_provider
+
+_BANNER60 = '=' * 60
+_BANNER80 = '=' * 80
 
 
 def print_section(title: str):
     """打印分隔线"""
-    print(f'\n{"=" * 60}')
-    print(f'{title}')
-    print('=' * 60)
+    sys.stdout.write(f'\n{_BANNER60}\n{title}\n{_BANNER60}\n')
+
+
+def _run_in_order(conn_mgr: ConnectionManager, *examples: Callable[[ConnectionManager], Any]) -> None:
+    """在同一线程中按顺序运行一组相互依赖的示例"""
+    for example in examples:
+        example(conn_mgr)
+
+
+def get_existing_tables(conn_mgr) -> set[str]:
+    """一次查询获取数据库中所有表名
+
+    Args:
+        conn_mgr: 连接管理器
+
+    Returns:
+        set[str]: 已存在的表名集合
+    """
+    return set(conn_mgr.inspector.get_table_names())
 
 
-def check_table_exists(conn_mgr, table_name: str) -> bool:
+def check_table_exists(conn_mgr, table_name: str, existing: set[str] | None = None) -> bool:
     """检查表是否存在
 
     Args:
         conn_mgr: 连接管理器
         table_name: 表名
+        existing: 预先获取的表名集合(可选, 批量检查时传入以避免逐表查询)
 
     Returns:
         bool: 表是否存在
     """
-    inspector = inspect(conn_mgr.engine)
-    return inspector.has_table(table_name)
+    if existing is not None:
+        return table_name in existing
+    return conn_mgr.inspector.has_table(table_name)
 
 
-def create_table_if_not_exists(conn_mgr, model_class, table_name: str | None = None):
+def create_table_if_not_exists(conn_mgr, model_class, table_name: str | None = None, existing: set[str] | None = None):
     """检查表是否存在, 不存在则创建
 
     Args:
         conn_mgr: 连接管理器
         model_class: 模型类
         table_name: 表名(可选, 默认从模型类获取)
+        existing: 预先获取的表名集合(可选, 创建成功后会加入新表名)
     """
     if table_name is None:
         table_name = model_class.__tablename__  # type: ignore[attr-defined]
 
-    inspector = inspect(conn_mgr.engine)
-
-    if inspector.has_table(table_name):
+    if check_table_exists(conn_mgr, table_name, existing):
         print(f'✅ 表 {table_name} 已存在')
         return False
     print(f'⚠️  表 {table_name} 不存在, 正在创建...')
     # 只创建这个模型的表
     model_class.__table__.create(conn_mgr.engine, checkfirst=True)  # type: ignore[attr-defined]
+    # 表结构已变化,清除复用Inspector的元数据缓存
+    conn_mgr.inspector.clear_cache()
+    if existing is not None:
+        existing.add(table_name)
     print(f'✅ 表 {table_name} 创建成功')
     return True
 
 
-def example_1_check_table_exists():
+def example_1_check_table_exists(conn_mgr: ConnectionManager):
     """示例 1: 检查表是否存在"""
     print_section('示例 1: 检查表是否存在')
 
-    conn_mgr = create_connection_manager(db_key='default')
+    # 一次获取全部表名, 之后的检查都在内存中完成
+    existing = get_existing_tables(conn_mgr)
 
     # 检查 users 表
     table_name = 'users'
-    exists = check_table_exists(conn_mgr, table_name)
+    exists = check_table_exists(conn_mgr, table_name, existing)
 
     if exists:
         print(f'✅ 表 {table_name} 存在')
@@ -82,21 +114,17 @@ def example_1_check_table_exists():
     tables_to_check = ['users', 'user_profiles', 'articles', 'non_existent_table']
     print('\n检查多个表:')
     for tbl in tables_to_check:
-        exists = check_table_exists(conn_mgr, tbl)
+        exists = check_table_exists(conn_mgr, tbl, existing)
         status = '✅ 存在' if exists else '❌ 不存在'
         print(f'   {tbl}: {status}')
 
-    conn_mgr.dispose()
-
 
-def example_2_create_if_not_exists():
+def example_2_create_if_not_exists(conn_mgr: ConnectionManager):
     """示例 2: 检查并创建表"""
     print_section('示例 2: 检查并创建表(如果不存在)')
 
     from user import UserModel
 
-    conn_mgr = create_connection_manager(db_key='default')
-
     # 检查并创建 users 表
     created = create_table_if_not_exists(conn_mgr, UserModel, 'users')
 
@@ -105,10 +133,8 @@ def example_2_create_if_not_exists():
     else:
         print('表已经存在, 无需创建')
 
-    conn_mgr.dispose()
-
 
-def example_3_create_test_table():
+def example_3_create_test_table(conn_mgr: ConnectionManager):
     """示例 3: 创建测试表"""
     print_section('示例 3: 创建新的测试表')
 
@@ -121,8 +147,6 @@ def example_3_create_test_table():
         name = Column(String(100), nullable=False)
         description = Column(String(500))
 
-    conn_mgr = create_connection_manager(db_key='default')
-
     # 检查并创建
     table_name = 'test_example_table'
     print(f'准备创建测试表: {table_name}')
@@ -133,16 +157,13 @@ def example_3_create_test_table():
         print(f'✅ 新表 {table_name} 创建成功')
 
         # 显示表结构
-        inspector = inspect(conn_mgr.engine)
-        columns = inspector.get_columns(table_name)
+        columns = conn_mgr.inspector.get_columns(table_name)
         print('\n表结构:')
         for col in columns:
             print(f'   - {col["name"]}: {col["type"]}')
 
-    conn_mgr.dispose()
 
-
-def example_4_batch_create_tables():
+def example_4_batch_create_tables(conn_mgr: ConnectionManager):
     """示例 4: 批量创建多个表"""
     print_section('示例 4: 批量创建多个表')
 
@@ -166,33 +187,29 @@ def example_4_batch_create_tables():
         content = Column(String(1000), nullable=False)
         author_id = Column(Integer)
 
-    conn_mgr = create_connection_manager(db_key='default')
-
-    # 批量创建
-    models = [
-        (Category, 'categories_example'),
-        (Tag, 'tags_example'),
-        (Comment, 'comments_example'),
-    ]
+    # 批量创建: 一次 create_all 在同一连接上完成全部 DDL
+    tables = [Category.__table__, Tag.__table__, Comment.__table__]  # type: ignore[attr-defined]
 
     print('批量创建表:')
-    created_count = 0
-    for model, table_name in models:
-        created = create_table_if_not_exists(conn_mgr, model, table_name)
-        if created:
-            created_count += 1
+    existing = get_existing_tables(conn_mgr)
+    to_create = [table for table in tables if table.name not in existing]
+    for table in tables:
+        if table.name in existing:
+            print(f'✅ 表 {table.name} 已存在')
 
-    print(f'\n✅ 共创建了 {created_count} 个新表')
+    if to_create:
+        Base.metadata.create_all(conn_mgr.engine, tables=to_create, checkfirst=True)
+        conn_mgr.inspector.clear_cache()
+        for table in to_create:
+            print(f'✅ 表 {table.name} 创建成功')
 
-    conn_mgr.dispose()
+    print(f'\n✅ 共创建了 {len(to_create)} 个新表')
 
 
-def example_5_drop_table():
+def example_5_drop_table(conn_mgr: ConnectionManager):
     """示例 5: 删除表"""
     print_section('示例 5: 删除测试表')
 
-    conn_mgr = create_connection_manager(db_key='default')
-
     # 要删除的测试表
     test_tables = [
         'test_example_table',
@@ -202,66 +219,55 @@ def example_5_drop_table():
     ]
 
     print('删除测试表:')
-    inspector = inspect(conn_mgr.engine)
+    existing = get_existing_tables(conn_mgr)
+    to_drop = [table_name for table_name in test_tables if table_name in existing]
 
     for table_name in test_tables:
-        if inspector.has_table(table_name):
-            # 使用原生 SQL 删除
-            try:
-                with conn_mgr.engine.connect() as connection:
-                    connection.execute(text(f'DROP TABLE IF EXISTS {table_name}'))
-                    connection.commit()
-                print(f'   ✅ 已删除表: {table_name}')
-            except Exception as e:
-                print(f'   ❌ 删除表 {table_name} 失败: {e}')
-        else:
+        if table_name not in existing:
             print(f'   ⚠️  表不存在: {table_name}')
 
-    conn_mgr.dispose()
+    if to_drop:
+        # 使用原生 SQL 删除: 一次连接、一个事务内完成全部删除
+        try:
+            with conn_mgr.engine.begin() as connection:
+                for table_name in to_drop:
+                    connection.execute(text(f'DROP TABLE IF EXISTS {table_name}'))
+            for table_name in to_drop:
+                print(f'   ✅ 已删除表: {table_name}')
+        except Exception as e:
+            print(f'   ❌ 删除表失败: {e}')
 
 
-def example_6_get_all_tables():
+def example_6_get_all_tables(conn_mgr: ConnectionManager):
     """示例 6: 列出所有表"""
     print_section('示例 6: 列出数据库中的所有表')
 
-    conn_mgr = create_connection_manager(db_key='default')
-    inspector = inspect(conn_mgr.engine)
-
     # 获取所有表名
-    table_names = inspector.get_table_names()
+    table_names = conn_mgr.inspector.get_table_names()
 
     print(f'数据库中共有 {len(table_names)} 个表:')
     for idx, table_name in enumerate(table_names, 1):
         print(f'   {idx}. {table_name}')
 
-    conn_mgr.dispose()
-
 
-def example_7_practical_usage():
+def example_7_practical_usage(conn_mgr: ConnectionManager):
     """示例 7: 实际应用场景"""
     print_section('示例 7: 实际应用 - 确保表存在后再操作')
 
     from user import UserModel
 
-    from xtsqlorm import create_repository
-
-    conn_mgr = create_connection_manager(db_key='default')
-
     print('场景: 在应用启动时, 确保必要的表都已创建\n')
 
     # 1. 检查并创建表
     print('步骤 1: 检查并创建 users 表')
     create_table_if_not_exists(conn_mgr, UserModel, 'users')
 
-    # 2. 创建仓储并使用
+    # 2. 创建仓储并使用(复用同一个连接管理器)
     print('\n步骤 2: 创建仓储并查询数据')
-    user_repo = create_repository(UserModel, db_key='default')
+    user_repo = create_repository(UserModel, session_provider=create_session_provider(connection_manager=conn_mgr))
     total = user_repo.count()
     print(f'✅ 用户表记录总数: {total}')
 
-    # 3. 清理
-    conn_mgr.dispose()
-
 
 def main():
     """主函数"""
@@ -269,15 +275,25 @@ def main():
     print('xtsqlorm 表管理示例')
     print('=' * 80)
 
-    example_1_check_table_exists()
-    example_2_create_if_not_exists()
-    example_3_create_test_table()
-    example_4_batch_create_tables()
-    example_6_get_all_tables()
-    example_7_practical_usage()
-
-    # 清理：删除测试表
-    example_5_drop_table()
+    # 所有示例共用一个连接管理器(一个引擎和连接池)
+    conn_mgr = create_connection_manager(db_key='default')
+    try:
+        # 以数据库I/O为主的示例并发运行;操作同一张表或定义模型类的示例放在同一线程内按序执行,
+        # 输出按提交顺序依次打印
+        output = ThreadBufferedOutput(sys.stdout)
+        with redirect_stdout(output), ThreadPoolExecutor(max_workers=3) as executor:
+            futures = [
+                executor.submit(output.run, _run_in_order, conn_mgr, example_1_check_table_exists),
+                executor.submit(output.run, _run_in_order, conn_mgr, example_2_create_if_not_exists, example_7_practical_usage),
+                executor.submit(output.run, _run_in_order, conn_mgr, example_3_create_test_table, example_4_batch_create_tables, example_6_get_all_tables),
+            ]
+        for future in futures:
+            sys.stdout.write(future.result())
+
+        # 清理：删除测试表(依赖前面创建的表,最后串行执行)
+        example_5_drop_table(conn_mgr)
+    finally:
+        conn_mgr.dispose()
 
     print('\n' + '=' * 80)
     print('🎉 所有示例运行完成!')
@@ -20,16 +20,18 @@ Github       : https://github.com/sandorn/xtsqlorm
 from __future__ import annotations
 
 import asyncio
+import sys
 
 from xtlog import mylog as log
 
+_BANNER60 = '=' * 60
+_BANNER80 = '=' * 80
+
 
 async def example_async_connection_manager():
     """示例 1: 异步连接管理器"""
     try:
-        log.info('\n' + '=' * 60)
-        log.info('示例 1: AsyncConnectionManager - 异步连接管理')
-        log.info('=' * 60)
+        log.info(f'\n{_BANNER60}\n示例 1: AsyncConnectionManager - 异步连接管理\n{_BANNER60}')
 
         # 导入异步连接管理器
         from xtsqlorm import create_async_connection_manager
@@ -62,9 +64,7 @@ async def example_async_session_provider():
     """示例 2: 异步会话提供者"""
     async_conn_mgr = None
     try:
-        log.info('\n' + '=' * 60)
-        log.info('示例 2: AsyncSessionProvider - 异步会话和事务管理')
-        log.info('=' * 60)
+        log.info(f'\n{_BANNER60}\n示例 2: AsyncSessionProvider - 异步会话和事务管理\n{_BANNER60}')
 
         # 导入异步会话提供者
         from xtsqlorm import create_async_connection_manager, create_async_session_provider
@@ -94,9 +94,7 @@ async def example_reflect_table_async():
     """示例 3: 异步反射表结构"""
     # 注意: reflect_table_async 内部会创建临时的 AsyncConnectionManager 并自动清理
     try:
-        log.info('\n' + '=' * 60)
-        log.info('示例 3: reflect_table_async - 异步反射表结构')
-        log.info('=' * 60)
+        log.info(f'\n{_BANNER60}\n示例 3: reflect_table_async - 异步反射表结构\n{_BANNER60}')
 
         # 导入异步反射函数
         from xtsqlorm import reflect_table_async
@@ -115,20 +113,20 @@ async def example_reflect_table_async():
         raise
 
 
-async def example_async_repository():
-    """示例 4: 异步仓储模式"""
+async def example_async_repository(user_model: type):
+    """示例 4: 异步仓储模式
+
+    Args:
+        user_model: 示例3反射得到的模型类
+    """
     async_conn_mgr = None
     try:
-        log.info('\n' + '=' * 60)
-        log.info('示例 4: AsyncRepository - 异步仓储模式')
-        log.info('=' * 60)
+        log.info(f'\n{_BANNER60}\n示例 4: AsyncRepository - 异步仓储模式\n{_BANNER60}')
 
         # 导入异步工厂函数
-        from xtsqlorm import create_async_connection_manager, create_async_repository, create_async_session_provider, reflect_table_async
+        from xtsqlorm import create_async_connection_manager, create_async_repository, create_async_session_provider
 
-        # 首先异步反射表模型
-        user_model = await reflect_table_async('users2', db_key='default')
-        log.success(f'✅ 反射模型: {user_model.__name__}')
+        log.success(f'✅ 复用已反射模型: {user_model.__name__}')
 
         # 显式创建连接管理器以便后续清理
         async_conn_mgr = create_async_connection_manager(db_key='default')
@@ -161,39 +159,38 @@ async def example_async_repository():
             await async_conn_mgr.dispose()
 
 
-async def example_async_full_workflow():
-    """示例 5: 异步完整工作流 - 使用工厂函数"""
-    async_conn_mgr1 = None
-    async_conn_mgr2 = None
-    async_conn_mgr3 = None
+async def example_async_full_workflow(user_model: type):
+    """示例 5: 异步完整工作流 - 使用工厂函数
+
+    Args:
+        user_model: 示例3反射得到的模型类
+    """
+    async_conn_mgr = None
     try:
-        log.info('\n' + '=' * 60)
-        log.info('示例 5: 异步完整工作流 - 三种使用方式')
-        log.info('=' * 60)
+        log.info(f'\n{_BANNER60}\n示例 5: 异步完整工作流 - 三种使用方式\n{_BANNER60}')
 
-        from xtsqlorm import create_async_connection_manager, create_async_repository, create_async_session_provider, reflect_table_async
+        from xtsqlorm import create_async_connection_manager, create_async_repository, create_async_session_provider
+
+        # 三种方式共享同一个连接管理器(同一连接池),仅在逻辑上区分
+        async_conn_mgr = create_async_connection_manager(db_key='default')
 
         # 方式1: 显式构建 - 最清晰的依赖关系和资源管理
         log.info('\n【方式1】显式构建异步依赖链:')
-        user_model = await reflect_table_async('users2', db_key='default')
-        async_conn_mgr1 = create_async_connection_manager(db_key='default')
-        async_provider1 = create_async_session_provider(connection_manager=async_conn_mgr1)
+        async_provider1 = create_async_session_provider(connection_manager=async_conn_mgr)
         async_repo1 = create_async_repository(user_model, session_provider=async_provider1)
         count1 = await async_repo1.count()  # type: ignore[attr-defined]
         log.success(f'✅ 用户总数(方式1): {count1}')
 
         # 方式2: 共享模型 - 复用已反射的模型类
         log.info('\n【方式2】复用模型类:')
-        async_conn_mgr2 = create_async_connection_manager(db_key='default')
-        async_provider2 = create_async_session_provider(connection_manager=async_conn_mgr2)
+        async_provider2 = create_async_session_provider(connection_manager=async_conn_mgr)
         async_repo2 = create_async_repository(user_model, session_provider=async_provider2)
         count2 = await async_repo2.count()  # type: ignore[attr-defined]
         log.success(f'✅ 用户总数(方式2): {count2}')
 
         # 方式3: 外部事务管理 - 复杂操作
         log.info('\n【方式3】外部异步事务管理:')
-        async_conn_mgr3 = create_async_connection_manager(db_key='default')
-        async_provider3 = create_async_session_provider(connection_manager=async_conn_mgr3)
+        async_provider3 = create_async_session_provider(connection_manager=async_conn_mgr)
 
         async with async_provider3.transaction():
             async_repo3 = create_async_repository(user_model, session_provider=async_provider3)
@@ -207,27 +204,22 @@ async def example_async_full_workflow():
         log.error(f'\n❌ 示例失败: {e!s}')
         raise
     finally:
-        # 清理所有资源
-        if async_conn_mgr1:
-            await async_conn_mgr1.dispose()
-        if async_conn_mgr2:
-            await async_conn_mgr2.dispose()
-        if async_conn_mgr3:
-            await async_conn_mgr3.dispose()
+        # 清理资源(共享的连接管理器只需释放一次)
+        if async_conn_mgr:
+            await async_conn_mgr.dispose()
 
 
-async def example_async_crud_operations():
-    """示例 6: 异步CRUD操作"""
+async def example_async_crud_operations(user_model: type):
+    """示例 6: 异步CRUD操作
+
+    Args:
+        user_model: 示例3反射得到的模型类
+    """
     async_conn_mgr = None
     try:
-        log.info('\n' + '=' * 60)
-        log.info('示例 6: 异步CRUD操作 - 创建、读取、更新、删除')
-        log.info('=' * 60)
-
-        from xtsqlorm import create_async_connection_manager, create_async_repository, create_async_session_provider, reflect_table_async
+        log.info(f'\n{_BANNER60}\n示例 6: 异步CRUD操作 - 创建、读取、更新、删除\n{_BANNER60}')
 
-        # 反射表模型
-        user_model = await reflect_table_async('users2', db_key='default')
+        from xtsqlorm import create_async_connection_manager, create_async_repository, create_async_session_provider
 
         # 显式创建连接管理器以便后续清理
         async_conn_mgr = create_async_connection_manager(db_key='default')
@@ -275,31 +267,43 @@ async def example_async_crud_operations():
 
 async def main():
     """主函数 - 运行所有异步示例"""
-    log.info('=' * 80)
-    log.info('xtsqlorm 异步功能示例 - 完整演示')
-    log.info('=' * 80)
-
-    # 示例1: 异步连接管理器
-    await example_async_connection_manager()
-
-    # 示例2: 异步会话提供者
-    await example_async_session_provider()
+    log.info(f'{_BANNER80}\nxtsqlorm 异步功能示例 - 完整演示\n{_BANNER80}')
 
-    # 示例3: 异步反射表结构
-    await example_reflect_table_async()
+    failed: list[tuple[str, BaseException]] = []
 
-    # 示例4: 异步仓储模式
-    await example_async_repository()
-
-    # 示例5: 异步完整工作流
-    await example_async_full_workflow()
-
-    # 示例6: 异步CRUD操作
-    await example_async_crud_operations()
-
-    log.info('=' * 80)
-    log.success('🎉 所有异步示例运行完成!')
-    log.info('=' * 80)
+    # 示例3: 异步反射表结构 - 反射一次,得到的模型由示例4-6复用
+    try:
+        user_model = await example_reflect_table_async()
+    except Exception as e:
+        failed.append((example_reflect_table_async.__name__, e))
+        user_model = None
+
+    # 其余示例各自创建连接资源,互不依赖,并发运行以重叠网络等待
+    examples = [
+        example_async_connection_manager(),  # 示例1: 异步连接管理器
+        example_async_session_provider(),  # 示例2: 异步会话提供者
+    ]
+    if user_model is not None:
+        examples += [
+            example_async_repository(user_model),  # 示例4: 异步仓储模式
+            example_async_full_workflow(user_model),  # 示例5: 异步完整工作流
+            example_async_crud_operations(user_model),  # 示例6: 异步CRUD操作
+        ]
+    results = await asyncio.gather(*examples, return_exceptions=True)
+    failed += [(example.__name__, result) for example, result in zip(examples, results, strict=True) if isinstance(result, BaseException)]
+
+    for name, error in failed:
+        log.error(f'❌ [{name}] 失败: {error!s}')
+
+    log.info(_BANNER80)
+    if failed:
+        log.warning(f'⚠️  异步示例运行完成, {len(failed)} 个失败')
+    else:
+        log.success('🎉 所有异步示例运行完成!')
+    log.info(_BANNER80)
+
+    if failed:
+        sys.exit(1)
 
 
 if __name__ == '__main__':
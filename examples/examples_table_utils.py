@@ -18,20 +18,22 @@ Github       : https://github.com/sandorn/xtsqlorm
 
 from __future__ import annotations
 
-import pprint
+import json
 
 from xtlog import mylog as log
 
 from xtsqlorm.table_utils import generate_model_file, get_or_create_table_model, reflect_table
 
+# 预先构建的分隔线
+_BANNER60 = '=' * 60
+_BANNER80 = '=' * 80
+
 
 def example_get_or_create_table_model():
     """示例: 智能获取或创建表模型(两种模式)"""
 
     try:
-        log.info('\n' + '=' * 60)
-        log.info('示例 1: get_or_create_table_model - 智能表模型管理')
-        log.info('=' * 60)
+        log.info(f'\n{_BANNER60}\n示例 1: get_or_create_table_model - 智能表模型管理\n{_BANNER60}')
 
         # ========== 模式1: 仅反射现有表(new_table_name=None)==========
         log.info('\n【模式1】仅反射现有表:')
@@ -40,16 +42,13 @@ def example_get_or_create_table_model():
             db_key='default',
         )
         log.success(f'✅ 反射模型: {reflect_model.__name__} | 表名: {reflect_model.__tablename__}')
-        log.info(f'   列数: {len(reflect_model.__table__.columns)}')
-        log.info(f'   列名: {[col.name for col in reflect_model.__table__.columns]}')
+        log.info(f'   列数: {len(reflect_model.__table__.columns)}\n   列名: {reflect_model.__table__.columns.keys()}')
 
         # ========== 模式2: 复制表结构创建新表(演示用法)==========
         log.info('\n【模式2】复制表结构创建新表:')
         backup_model = get_or_create_table_model('users2', new_table_name='users2_backup', db_key='default')
 
-        log.info(f'   备份模型: {backup_model.__name__} | 表名: {backup_model.__tablename__}')
-        log.info(f'   列数: {len(backup_model.__table__.columns)}')
-        log.info(f'   列名: {[col.name for col in backup_model.__table__.columns]}')
+        log.info(f'   备份模型: {backup_model.__name__} | 表名: {backup_model.__tablename__}\n   列数: {len(backup_model.__table__.columns)}\n   列名: {backup_model.__table__.columns.keys()}')
 
     except Exception as e:
         log.error(f'\n❌ 示例失败: {e!s}')
@@ -59,9 +58,7 @@ def example_get_or_create_table_model():
 def example_generate_model_file():
     """示例: 使用sqlacodegen生成模型文件"""
     try:
-        log.info('\n' + '=' * 60)
-        log.info('示例 2: generate_model_file - 生成静态模型文件')
-        log.info('=' * 60)
+        log.info(f'\n{_BANNER60}\n示例 2: generate_model_file - 生成静态模型文件\n{_BANNER60}')
 
         result = generate_model_file(
             tablename='users2',
@@ -80,9 +77,7 @@ def example_generate_model_file():
 def example_reflect_table():
     """示例: 同步反射表结构"""
     try:
-        log.info('\n' + '=' * 60)
-        log.info('示例 3: reflect_table - 同步反射表结构')
-        log.info('=' * 60)
+        log.info(f'\n{_BANNER60}\n示例 3: reflect_table - 同步反射表结构\n{_BANNER60}')
 
         # 反射表结构
         table_model = reflect_table(
@@ -90,63 +85,49 @@ def example_reflect_table():
             db_key='default',
         )
 
-        # 打印模型信息
         log.success('\n✅ 成功反射表模型')
-        log.info(f'   模型类名: {table_model.__name__}')
-        log.info(f'   表名: {table_model.__tablename__}')
-        log.info(f'   模型类型: {type(table_model)}')
-
-        # 打印表结构详细信息
-        log.info('\n📋 表结构详情:')
-        log.info(f'   列数量: {len(table_model.__table__.columns)}')
-
-        # 打印每一列的详细信息
-        log.info('\n📊 列定义:')
-        for col in table_model.__table__.columns:
-            log.info(f'   • {col.name}:')
-            log.info(f'     - 类型: {col.type}')
-            log.info(f'     - 主键: {col.primary_key}')
-            log.info(f'     - 可空: {col.nullable}')
-            if col.default:
-                log.info(f'     - 默认值: {col.default}')
-            if col.comment:
-                log.info(f'     - 注释: {col.comment}')
-
-        # 打印主键信息
-        primary_keys = [col.name for col in table_model.__table__.columns if col.primary_key]
+
+        # 一次遍历列集合,提取后续输出所需的全部列信息: (列名, 类型, 主键, 可空, 默认值, 注释)
+        cols = [(col.name, str(col.type), col.primary_key, col.nullable, str(col.default) if col.default else None, col.comment) for col in table_model.__table__.columns]
+        primary_keys = [name for name, _, is_pk, *_ in cols if is_pk]
+
+        # 模型信息、表结构、列定义、主键、外键和索引先收集到一起,最后一次性输出
+        lines = [
+            f'   模型类名: {table_model.__name__}',
+            f'   表名: {table_model.__tablename__}',
+            f'   模型类型: {type(table_model)}',
+            '\n📋 表结构详情:',
+            f'   列数量: {len(cols)}',
+            '\n📊 列定义:',
+        ]
+        for name, type_str, is_pk, nullable, default, comment in cols:
+            lines += [f'   • {name}:', f'     - 类型: {type_str}', f'     - 主键: {is_pk}', f'     - 可空: {nullable}']
+            if default:
+                lines.append(f'     - 默认值: {default}')
+            if comment:
+                lines.append(f'     - 注释: {comment}')
+
         if primary_keys:
-            log.info(f'\n🔑 主键列: {", ".join(primary_keys)}')
+            lines.append(f'\n🔑 主键列: {", ".join(primary_keys)}')
 
-        # 打印外键信息
         if table_model.__table__.foreign_keys:
-            log.info('\n🔗 外键:')
-            for fk in table_model.__table__.foreign_keys:
-                log.info(f'   {fk.parent.name} -> {fk.target_fullname}')
+            lines.append('\n🔗 外键:')
+            lines.extend(f'   {fk.parent.name} -> {fk.target_fullname}' for fk in table_model.__table__.foreign_keys)
 
-        # 打印索引信息
         if table_model.__table__.indexes:
-            log.info('\n📌 索引:')
-            for idx in table_model.__table__.indexes:
-                log.info(f'   {idx.name}: {[c.name for c in idx.columns]}')
+            lines.append('\n📌 索引:')
+            lines.extend(f'   {idx.name}: {[c.name for c in idx.columns]}' for idx in table_model.__table__.indexes)
 
-        # 使用pprint打印完整结构
-        log.info('\n🔍 完整表结构 (字典格式):')
+        log.info('\n'.join(lines))
+
+        # 以JSON格式打印完整结构(字典只包含str/bool/None,可直接序列化)
         table_dict = {
             '表名': table_model.__tablename__,
             '模型类': table_model.__name__,
-            '列定义': [
-                {
-                    '列名': col.name,
-                    '类型': str(col.type),
-                    '主键': col.primary_key,
-                    '可空': col.nullable,
-                    '默认值': str(col.default) if col.default else None,
-                }
-                for col in table_model.__table__.columns
-            ],
+            '列定义': [dict(zip(('列名', '类型', '主键', '可空', '默认值'), col[:5], strict=True)) for col in cols],
             '主键': primary_keys,
         }
-        pprint.pprint(table_dict, indent=2, width=100)  # noqa
+        log.info(f'\n🔍 完整表结构 (字典格式):\n{json.dumps(table_dict, indent=2, ensure_ascii=False)}')
 
         log.success('\n✨ 同步反射示例完成!\n')
         return table_model
@@ -159,9 +140,7 @@ def example_reflect_table():
 def example_new_architecture():
     """示例: 使用新架构的工厂函数创建 ORM 操作对象"""
     try:
-        log.info('\n' + '=' * 60)
-        log.info('示例 4: 新架构 - 使用工厂函数创建 ORM 操作')
-        log.info('=' * 60)
+        log.info(f'\n{_BANNER60}\n示例 4: 新架构 - 使用工厂函数创建 ORM 操作\n{_BANNER60}')
 
         # 导入新架构的组件
         from xtsqlorm import create_connection_manager, create_orm_operations, create_repository, create_session_provider
@@ -220,8 +199,8 @@ def example_new_architecture():
                 repo = uow.repository(user_model)
                 log.success('✅ 在工作单元中创建仓储')
 
-                # 查询操作
-                all_users = repo.get_all(limit=5)
+                # 查询操作(只加载需要的列)
+                all_users = repo.get_all(limit=5, only=['id', 'name'])
                 log.success(f'✅ 查询前5个用户: 共 {len(all_users)} 条')
 
                 # 事务会自动提交
@@ -238,9 +217,7 @@ def example_new_architecture():
 
 
 if __name__ == '__main__':
-    log.info('=' * 80)
-    log.info('xtsqlorm 表工具函数示例 - 新架构版本')
-    log.info('=' * 80)
+    log.info(f'{_BANNER80}\nxtsqlorm 表工具函数示例 - 新架构版本\n{_BANNER80}')
 
     # ==================== 运行示例 ====================
     # 示例1: 智能获取或创建表模型(新功能,推荐)
@@ -1,12 +1,15 @@
 # !/usr/bin/env python3
 """
 测试所有示例文件
+
+用法: python examples/test_all_examples.py [--serial]
 """
 
 from __future__ import annotations
 
 import subprocess
 import sys
+from concurrent.futures import ThreadPoolExecutor
 
 examples = [
     ('示例01: 基础同步CRUD', 'example_01_basic_sync.py'),
@@ -19,32 +22,42 @@ examples = [
     ('示例08: 表管理', 'example_08_table_management.py'),
 ]
 
-results = []
-
-for name, filename in examples:
-    print(f'\n{"=" * 70}')
-    print(f'测试: {name} ({filename})')
-    print('=' * 70)
 
+def run_example(name: str, filename: str) -> tuple[str, str | None, str]:
+    """在子进程中运行一个示例,返回(状态, 错误信息, 输出文本)"""
+    out = [f'\n{"=" * 70}', f'测试: {name} ({filename})', '=' * 70]
     try:
         result = subprocess.run([sys.executable, f'examples/{filename}'], capture_output=True, text=True, timeout=30)
 
         if result.returncode == 0:
-            print(f'✅ {name} - 通过')
-            results.append((name, 'PASS', None))
-        else:
-            print(f'❌ {name} - 失败 (exit code={result.returncode})')
-            error_lines = result.stderr.splitlines()[-10:]  # 只显示最后10行错误
-            error = '\n'.join(error_lines)
-            print(f'错误信息:\n{error}')
-            results.append((name, 'FAIL', error))
+            out.append(f'✅ {name} - 通过')
+            return 'PASS', None, '\n'.join(out)
+
+        out.append(f'❌ {name} - 失败 (exit code={result.returncode})')
+        error_lines = result.stderr.splitlines()[-10:]  # 只显示最后10行错误
+        error = '\n'.join(error_lines)
+        out.append(f'错误信息:\n{error}')
+        return 'FAIL', error, '\n'.join(out)
 
     except subprocess.TimeoutExpired:
-        print(f'⏱️  {name} - 超时')
-        results.append((name, 'TIMEOUT', None))
+        out.append(f'⏱️  {name} - 超时')
+        return 'TIMEOUT', None, '\n'.join(out)
     except Exception as e:
-        print(f'💥 {name} - 异常: {e}')
-        results.append((name, 'ERROR', str(e)))
+        out.append(f'💥 {name} - 异常: {e}')
+        return 'ERROR', str(e), '\n'.join(out)
+
+
+# 各示例是独立的子进程,等待时间以数据库I/O为主,默认并发运行;--serial 逐个运行便于调试
+serial = '--serial' in sys.argv[1:]
+with ThreadPoolExecutor(max_workers=1 if serial else len(examples)) as executor:
+    futures = [executor.submit(run_example, name, filename) for name, filename in examples]
+
+    # 按示例顺序输出结果
+    results = []
+    for (name, _), future in zip(examples, futures, strict=True):
+        status, error, output = future.result()
+        print(output)
+        results.append((name, status, error))
 
 
 # 汇总结果
@@ -17,6 +17,7 @@ XT-SQLORM是一个基于SQLAlchemy的ORM框架,采用扁平化架构设计
 - repository: 通用仓储模式
 - uow: 工作单元模式
 - operations: 高级ORM操作
+- debug: 调试工具(SQL语句计数)
 
 异步架构:
 - async_engine: 异步连接引擎管理
@@ -42,6 +43,9 @@ from .async_session import AsyncSessionFactory, AsyncSessionProvider
 # ============ 基类和模型 ============
 from .base import Base, BaseModel, ItemMixin, ModelExt
 
+# ============ 调试工具 ============
+from .debug import count_queries
+
 # ============ 核心架构组件 ============
 from .engine import ConnectionManager
 
@@ -73,11 +77,11 @@ from .repository import Repository
 from .session import SessionFactory, SessionProvider
 
 # ============ 表工具 ============
-from .table_utils import generate_model_file, get_or_create_table_model, reflect_table, reflect_table_async
+from .table_utils import generate_model_file, get_or_create_table_model, reflect_table, reflect_table_async, reflect_tables
 
 # ============ 自定义类型 ============
 from .types import EnumType, JsonEncodedDict, UTCDateTime
-from .uow import UnitOfWork
+from .uow import BatchLoader, UnitOfWork
 
 # ============ 验证工具 ============
 from .validators import (
@@ -89,6 +93,7 @@ from .validators import (
     validate_enum,
     validate_in_choices,
     validate_ip,
+    validate_ips,
     validate_json,
     validate_length,
     validate_password_strength,
@@ -118,6 +123,7 @@ __all__ = (
     'SessionFactory',
     'SessionProvider',
     'UnitOfWork',
+    'BatchLoader',
     # ============ 异步核心组件 ============
     'AsyncConnectionManager',
     'AsyncRepository',
@@ -149,6 +155,9 @@ __all__ = (
     'get_or_create_table_model',
     'reflect_table',
     'reflect_table_async',
+    'reflect_tables',
+    # ============ 调试工具 ============
+    'count_queries',
     # ============ 基类 ============
     'Base',
     'BaseModel',
@@ -174,6 +183,7 @@ __all__ = (
     'validate_enum',
     'validate_in_choices',
     'validate_ip',
+    'validate_ips',
     'validate_json',
     'validate_length',
     'validate_password_strength',
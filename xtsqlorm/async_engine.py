@@ -17,6 +17,7 @@ Github       : https://github.com/sandorn/xtsqlorm
 
 from __future__ import annotations
 
+from collections.abc import Callable
 from typing import Any
 
 from sqlalchemy import text
@@ -26,6 +27,9 @@ from xtlog import mylog
 from .cfg import connect_str
 from .protocols import IAsyncConnectionManager
 
+# pool_status的键与连接池状态方法名
+_POOL_STATUS_ATTRS = (('size', 'size'), ('checked_out', 'checkedout'), ('overflow', 'overflow'), ('checked_in', 'checkedin'))
+
 
 class AsyncConnectionManager(IAsyncConnectionManager):
     """异步连接管理器 - 只负责异步连接池和引擎管理
@@ -89,6 +93,8 @@ class AsyncConnectionManager(IAsyncConnectionManager):
             pool_pre_ping=True,  # 自动检测失效连接
             **kwargs,
         )
+        # pool_status使用的(连接池, ((键, 状态方法), ...))缓存,dispose重建连接池后自动失效
+        self._pool_status_fns: tuple[Any, tuple[tuple[str, Callable[[], Any] | None], ...]] | None = None
         mylog.success(f'AsyncConnectionManager | 异步引擎已初始化: {self._engine.url}')
 
     def __str__(self) -> str:
@@ -99,6 +105,28 @@ class AsyncConnectionManager(IAsyncConnectionManager):
         """详细表示"""
         return f'AsyncConnectionManager(url={self._engine.url!r})'
 
+    async def __aenter__(self) -> AsyncConnectionManager:
+        """进入异步上下文管理器
+
+        Returns:
+            AsyncConnectionManager: 异步连接管理器实例
+
+        Example:
+            >>> async with AsyncConnectionManager(db_key='default') as async_conn_mgr:
+            ...     await async_conn_mgr.ping()
+        """
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """退出异步上下文管理器,释放连接池(即使代码块中发生异常)
+
+        Args:
+            exc_type: 异常类型
+            exc_val: 异常值
+            exc_tb: 异常追踪
+        """
+        await self.dispose()
+
     @property
     def engine(self) -> AsyncEngine:
         """获取SQLAlchemy异步引擎对象
@@ -108,9 +136,15 @@ class AsyncConnectionManager(IAsyncConnectionManager):
         """
         return self._engine
 
-    async def ping(self) -> bool:
+    async def ping(self, *, deep: bool = False) -> bool:
         """测试异步数据库连接是否正常
 
+        默认只从连接池签出一个连接:引擎启用了pool_pre_ping,签出池中已有连接时会自动检测其有效性,
+        新建连接则需完成握手,因此签出成功即说明数据库可用,无需再执行一次 SELECT 1。
+
+        Args:
+            deep: 是否在签出后额外执行 SELECT 1 做语句级检查,默认False
+
         Returns:
             bool: 连接正常返回True,否则返回False
 
@@ -121,7 +155,8 @@ class AsyncConnectionManager(IAsyncConnectionManager):
         """
         try:
             async with self._engine.connect() as conn:
-                await conn.execute(text('SELECT 1'))
+                if deep:
+                    await conn.execute(text('SELECT 1'))
             return True
         except Exception as e:
             mylog.error(f'AsyncConnectionManager@ping | 异步连接测试失败: {e}')
@@ -166,21 +201,17 @@ class AsyncConnectionManager(IAsyncConnectionManager):
         if pool is None:
             return {}
 
+        # 使用公共属性/方法,避免依赖私有API;状态方法只在首次访问(或连接池重建后)解析一次
+        cached = self._pool_status_fns
+        if cached is None or cached[0] is not pool:
+            fns = tuple((k, func if callable(func := getattr(pool, attr, None)) else None) for k, attr in _POOL_STATUS_ATTRS)
+            cached = self._pool_status_fns = (pool, fns)
+
         status = {}
-        # 使用公共属性/方法,避免依赖私有API
-        for k, attr in [
-            ('size', 'size'),
-            ('checked_out', 'checkedout'),
-            ('overflow', 'overflow'),
-            ('checked_in', 'checkedin'),
-        ]:
-            func = getattr(pool, attr, None)
-            if callable(func):
-                try:
-                    status[k] = func()
-                except Exception:
-                    status[k] = None
-            else:
+        for k, func in cached[1]:
+            try:
+                status[k] = func() if func is not None else None
+            except Exception:
                 status[k] = None
         return status
 
@@ -206,18 +206,24 @@ class AsyncRepository[T](IAsyncRepository[T]):
                 session.expunge(instance)
             return instances
 
-    async def count(self) -> int:
-        """异步统计记录总数
+    async def count(self, where_dict: dict[str, Any] | None = None) -> int:
+        """异步统计记录总数(在数据库端执行COUNT)
+
+        Args:
+            where_dict: 查询条件字典(可选)
 
         Returns:
-            int: 记录总数
+            int: 符合条件的记录数
 
         Example:
             >>> total = await user_repo.count()
             >>> print(f'共有 {total} 条记录')
+            >>> active = await user_repo.count({'is_active': True})
         """
         async with self._session_provider.transaction() as session:
             stmt = select(func.count()).select_from(self._model)
+            if where_dict:
+                stmt = stmt.filter_by(**where_dict)
             result = await session.execute(stmt)
             return result.scalar() or 0
 
@@ -19,6 +19,7 @@ Github       : https://github.com/sandorn/xtsqlorm
 
 from __future__ import annotations
 
+from asyncio import current_task
 from collections.abc import AsyncGenerator
 from contextlib import asynccontextmanager
 from typing import TYPE_CHECKING
@@ -36,7 +37,7 @@ class AsyncSessionFactory:
     """异步Session工厂 - 负责创建AsyncSession实例
 
     封装了SQLAlchemy的async_sessionmaker,提供统一的AsyncSession创建接口。
-    支持创建普通AsyncSession和线程安全的ScopedAsyncSession。
+    支持创建普通AsyncSession和按asyncio Task隔离的ScopedAsyncSession。
 
     Example:
         >>> factory = AsyncSessionFactory(async_connection_manager)
@@ -58,9 +59,10 @@ class AsyncSessionFactory:
             autoflush=True,
             expire_on_commit=True,
         )
+        # 以当前asyncio Task为作用域,每个Task独享一个AsyncSession
         self._scoped_factory = async_scoped_session(
             self._session_factory,
-            scopefunc=lambda: 0,  # 简单的scope function,异步环境中需要更复杂的逻辑
+            scopefunc=current_task,
         )
 
     def create_session(self) -> AsyncSession:
@@ -75,16 +77,29 @@ class AsyncSessionFactory:
         return self._session_factory()
 
     def create_scoped_session(self) -> AsyncSession:
-        """创建线程安全的AsyncSession
+        """获取当前asyncio Task的AsyncSession
 
         Returns:
-            AsyncSession: 线程安全的AsyncSession对象
+            AsyncSession: 当前Task的AsyncSession对象
 
         Note:
-            ScopedAsyncSession会在每个线程中维护独立的AsyncSession实例
+            ScopedAsyncSession会在每个asyncio Task中维护独立的AsyncSession实例,
+            Task结束前需调用remove_scoped_session()释放
         """
         return self._scoped_factory()
 
+    def has_scoped_session(self) -> bool:
+        """当前asyncio Task是否已持有ScopedAsyncSession
+
+        Returns:
+            bool: 已创建返回True,否则返回False
+        """
+        return self._scoped_factory.registry.has()
+
+    async def remove_scoped_session(self) -> None:
+        """关闭并移除当前asyncio Task的ScopedAsyncSession"""
+        await self._scoped_factory.remove()
+
 
 class AsyncSessionProvider(IAsyncSessionProvider):
     """异步会话提供者 - 统一的异步事务管理
@@ -146,6 +161,42 @@ class AsyncSessionProvider(IAsyncSessionProvider):
         """
         return self._session_factory.create_session()
 
+    def create_scoped_session(self) -> AsyncSession:
+        """获取当前asyncio Task的ScopedAsyncSession
+
+        同一Task内多次调用返回同一个AsyncSession,不同Task互不共享,
+        组合多个操作时可复用同一个AsyncSession及其identity map。
+
+        Returns:
+            AsyncSession: 当前Task的AsyncSession对象
+
+        Note:
+            调用者需要在Task结束时调用remove_session()释放
+
+        Example:
+            >>> provider = AsyncSessionProvider(async_connection_manager)
+            >>> session = provider.create_scoped_session()
+            >>> try:
+            ...     user = await session.get(User, 1)
+            ...     await session.commit()
+            >>> finally:
+            ...     await provider.remove_session()
+        """
+        return self._session_factory.create_scoped_session()
+
+    def has_scoped_session(self) -> bool:
+        """当前asyncio Task是否已持有ScopedAsyncSession
+
+        Returns:
+            bool: 已创建返回True,否则返回False
+        """
+        return self._session_factory.has_scoped_session()
+
+    async def remove_session(self) -> None:
+        """关闭并移除当前asyncio Task的ScopedAsyncSession(Task结束时调用)"""
+        await self._session_factory.remove_scoped_session()
+        mylog.debug('AsyncSessionProvider | ScopedAsyncSession已移除')
+
     @asynccontextmanager
     async def transaction(self) -> AsyncGenerator[AsyncSession]:
         """异步事务上下文管理器(推荐用法)
@@ -23,6 +23,7 @@ Github       : https://github.com/sandorn/xtsqlorm
 from __future__ import annotations
 
 from enum import Enum
+from functools import lru_cache
 
 
 class DB_CFG(Enum):  # noqa
@@ -99,9 +100,12 @@ class Driver_Map(Enum):  # noqa
     monetdb = ({'monetdb': 'monetdb', 'lite': 'monetdb+lite'},)
 
 
+@lru_cache(maxsize=32)
 def connect_str(key: str = 'default', odbc: str | None = None) -> str:
     """生成数据库连接字符串的工具函数
 
+    结果按(key, odbc)缓存,重复创建连接管理器时不再重新拼接。
+
     Args:
         key: 数据库配置键名,对应DB_CFG中的配置项
         odbc: 可选,指定数据库驱动类型,默认使用配置中的数据库类型
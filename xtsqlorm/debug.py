@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+==============================================================
+Description  : 调试工具 - SQL语句计数
+Author       : sandorn sandorn@live.cn
+LastEditTime : 2025-10-24 15:00:00
+Github       : https://github.com/sandorn/xtsqlorm
+
+本模块提供调试辅助工具:
+- count_queries: 上下文管理器,记录代码块内执行的SQL语句
+
+适用场景:
+- 在测试中断言某个操作的查询次数上限,及早发现N+1查询
+- 排查单个操作实际发出了哪些SQL
+==============================================================
+"""
+
+from __future__ import annotations
+
+from collections.abc import Generator
+from contextlib import contextmanager
+from typing import Any
+
+from sqlalchemy import event
+from sqlalchemy.engine import Connection, Engine
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine
+
+
+@contextmanager
+def count_queries(bind: Engine | Connection | AsyncEngine | AsyncConnection) -> Generator[list[str]]:
+    """记录代码块内通过bind执行的所有SQL语句
+
+    监听before_cursor_execute事件,将每条发往数据库的语句追加到列表中,
+    退出上下文时移除监听器。列表长度即为查询次数。
+
+    Args:
+        bind: 要监听的Engine/Connection(异步版本自动取其同步对象)
+
+    Yields:
+        list[str]: 已执行的SQL语句列表(随执行实时追加)
+
+    Example:
+        >>> conn_mgr = create_connection_manager()
+        >>> repo = create_repository(User)
+        >>> with count_queries(conn_mgr.engine) as queries:
+        ...     repo.get_all()
+        >>> assert len(queries) == 1
+    """
+    if isinstance(bind, AsyncEngine):
+        target: Engine | Connection = bind.sync_engine
+    elif isinstance(bind, AsyncConnection):
+        target = bind.sync_connection  # type: ignore[assignment]
+    else:
+        target = bind
+
+    statements: list[str] = []
+
+    def _before_cursor_execute(conn: Any, cursor: Any, statement: str, parameters: Any, context: Any, executemany: bool) -> None:
+        statements.append(statement)
+
+    event.listen(target, 'before_cursor_execute', _before_cursor_execute)
+    try:
+        yield statements
+    finally:
+        event.remove(target, 'before_cursor_execute', _before_cursor_execute)
+
+
+__all__ = ['count_queries']
@@ -17,10 +17,12 @@ Github       : https://github.com/sandorn/xtsqlorm
 
 from __future__ import annotations
 
+import time
+from functools import cached_property
 from typing import Any
 
-from sqlalchemy import create_engine, text
-from sqlalchemy.engine import Engine
+from sqlalchemy import create_engine, inspect, text
+from sqlalchemy.engine import Engine, Inspector
 from xtlog import mylog
 
 from .cfg import connect_str
@@ -57,10 +59,10 @@ class ConnectionManager(IConnectionManager):
         self,
         db_key: str = 'default',
         url: str | None = None,
-        pool_size: int = 5,
+        pool_size: int = 20,
         max_overflow: int = 10,
         pool_timeout: int = 30,
-        pool_recycle: int = 3600,
+        pool_recycle: int = 1800,
         echo: bool = False,
         **kwargs: Any,
     ):
@@ -69,26 +71,32 @@ class ConnectionManager(IConnectionManager):
         Args:
             db_key: 数据库配置键,用于从配置文件获取连接信息
             url: 数据库连接URL,如果提供则优先使用
-            pool_size: 连接池大小,默认5
+            pool_size: 连接池大小,默认20
             max_overflow: 最大溢出连接数,默认10
             pool_timeout: 连接超时时间(秒),默认30
-            pool_recycle: 连接回收时间(秒),默认3600(1小时)
+            pool_recycle: 连接回收时间(秒),默认1800(30分钟)
             echo: 是否打印SQL日志,默认False
-            **kwargs: 其他SQLAlchemy引擎参数
+            **kwargs: 其他SQLAlchemy引擎参数,可覆盖默认的pool_pre_ping、query_cache_size等配置
         """
         if not url:
             url = connect_str(db_key)
 
-        self._engine = create_engine(
-            url,
-            pool_size=pool_size,
-            max_overflow=max_overflow,
-            pool_timeout=pool_timeout,
-            pool_recycle=pool_recycle,
-            echo=echo,
-            pool_pre_ping=True,  # 自动检测失效连接
+        # 默认连接池配置,kwargs中的同名参数优先
+        engine_kwargs: dict[str, Any] = {
+            'pool_size': pool_size,
+            'max_overflow': max_overflow,
+            'pool_timeout': pool_timeout,
+            'pool_recycle': pool_recycle,
+            'pool_pre_ping': True,  # 自动检测失效连接
+            'query_cache_size': 1200,  # SQL编译缓存容量,避免重复编译语句
+            'future': True,
+            'echo': echo,
             **kwargs,
-        )
+        }
+        self._engine = create_engine(url, **engine_kwargs)
+        # 最近一次ping成功的时间(time.monotonic),窗口期内直接返回True
+        self._last_ping_ok_ts: float = 0.0
+        self._ping_interval: float = 30.0
         mylog.success(f'ConnectionManager | 引擎已初始化: {self._engine.url}')
 
     def __str__(self) -> str:
@@ -99,6 +107,28 @@ class ConnectionManager(IConnectionManager):
         """详细表示"""
         return f'ConnectionManager(url={self._engine.url!r})'
 
+    def __enter__(self) -> ConnectionManager:
+        """进入上下文管理器
+
+        Returns:
+            ConnectionManager: 连接管理器实例
+
+        Example:
+            >>> with ConnectionManager(db_key='default') as conn_mgr:
+            ...     conn_mgr.ping()
+        """
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """退出上下文管理器,释放连接池(即使代码块中发生异常)
+
+        Args:
+            exc_type: 异常类型
+            exc_val: 异常值
+            exc_tb: 异常追踪
+        """
+        self.dispose()
+
     @property
     def engine(self) -> Engine:
         """获取SQLAlchemy引擎对象
@@ -108,9 +138,34 @@ class ConnectionManager(IConnectionManager):
         """
         return self._engine
 
-    def ping(self) -> bool:
+    @cached_property
+    def inspector(self) -> Inspector:
+        """获取绑定到引擎的Inspector(首次访问时创建,之后复用)
+
+        复用同一个Inspector可共享其info_cache,避免重复查询数据库元数据。
+
+        Returns:
+            Inspector: SQLAlchemy Inspector实例
+
+        Note:
+            info_cache不会感知DDL变更,表结构变化后需调用inspector.clear_cache()
+
+        Example:
+            >>> conn_mgr = ConnectionManager(db_key='default')
+            >>> if conn_mgr.inspector.has_table('users'):
+            ...     print(conn_mgr.inspector.get_columns('users'))
+        """
+        return inspect(self._engine)
+
+    def ping(self, *, force: bool = False) -> bool:
         """测试数据库连接是否正常
 
+        距上次成功ping不足30秒时直接返回True,不占用连接池连接;
+        失效连接由引擎的pool_pre_ping在签出时检测。
+
+        Args:
+            force: 是否忽略缓存强制执行 SELECT 1,默认False
+
         Returns:
             bool: 连接正常返回True,否则返回False
 
@@ -119,11 +174,15 @@ class ConnectionManager(IConnectionManager):
             >>> if conn_mgr.ping():
             ...     print('数据库连接正常')
         """
+        if not force and time.monotonic() - self._last_ping_ok_ts < self._ping_interval:
+            return True
         try:
             with self._engine.connect() as conn:
                 conn.execute(text('SELECT 1'))
+            self._last_ping_ok_ts = time.monotonic()
             return True
         except Exception as e:
+            self._last_ping_ok_ts = 0.0
             mylog.error(f'ConnectionManager@ping | 连接测试失败: {e}')
             return False
 
@@ -138,6 +197,7 @@ class ConnectionManager(IConnectionManager):
             >>> # ... 使用连接 ...
             >>> conn_mgr.dispose()  # 应用关闭时释放资源
         """
+        self.__dict__.pop('inspector', None)
         if hasattr(self, '_engine'):
             self._engine.dispose()
             mylog.info('ConnectionManager@dispose | 连接资源已释放')
@@ -152,6 +212,7 @@ class ConnectionManager(IConnectionManager):
                 - checked_out: 已签出的连接数
                 - overflow: 溢出连接数
                 - checked_in: 已签入的连接数
+                - status: 连接池状态摘要(pool.status())
 
         Example:
             >>> conn_mgr = ConnectionManager()
@@ -177,6 +238,7 @@ class ConnectionManager(IConnectionManager):
                     status[k] = None
             else:
                 status[k] = None
+        status['status'] = pool.status()
         return status
 
 
@@ -41,10 +41,10 @@ from .session import SessionProvider
 def create_connection_manager(
     db_key: str = 'default',
     url: str | None = None,
-    pool_size: int = 5,
+    pool_size: int = 20,
     max_overflow: int = 10,
     pool_timeout: int = 30,
-    pool_recycle: int = 3600,
+    pool_recycle: int = 1800,
     echo: bool = False,
     **kwargs: Any,
 ) -> ConnectionManager:
@@ -55,10 +55,10 @@ def create_connection_manager(
     Args:
         db_key: 数据库配置键,用于从配置文件获取连接信息,默认'default'
         url: 数据库连接URL,如果提供则优先使用此URL
-        pool_size: 连接池大小,默认5
+        pool_size: 连接池大小,默认20
         max_overflow: 最大溢出连接数,默认10
         pool_timeout: 连接超时时间(秒),默认30
-        pool_recycle: 连接回收时间(秒),默认3600(1小时)
+        pool_recycle: 连接回收时间(秒),默认1800(30分钟)
         echo: 是否打印SQL日志,默认False
         **kwargs: 其他SQLAlchemy引擎参数
 
@@ -88,6 +88,7 @@ def create_connection_manager(
 def create_session_provider(
     connection_manager: IConnectionManager | None = None,
     db_key: str = 'default',
+    share_transaction: bool = False,
     **kwargs: Any,
 ) -> SessionProvider:
     """创建会话提供者
@@ -97,6 +98,7 @@ def create_session_provider(
     Args:
         connection_manager: 连接管理器实例,如果为None则自动创建
         db_key: 当connection_manager为None时,用于创建ConnectionManager的数据库配置键
+        share_transaction: 嵌套调用transaction()时是否复用外层事务(SAVEPOINT),默认False
         **kwargs: 当connection_manager为None时,传递给create_connection_manager的其他参数
 
     Returns:
@@ -113,13 +115,14 @@ def create_session_provider(
     """
     if connection_manager is None:
         connection_manager = create_connection_manager(db_key=db_key, **kwargs)
-    return SessionProvider(connection_manager)
+    return SessionProvider(connection_manager, share_transaction=share_transaction)
 
 
 def create_repository[T](
     model: type[T],
     session_provider: ISessionProvider | None = None,
     db_key: str = 'default',
+    warm_up: bool = False,
     **kwargs: Any,
 ) -> Repository[T]:
     """创建仓储对象
@@ -133,6 +136,7 @@ def create_repository[T](
         model: ORM模型类
         session_provider: 会话提供者实例,如果为None则自动创建
         db_key: 当session_provider为None时,用于创建SessionProvider的数据库配置键
+        warm_up: 是否在创建后立即预热(建立连接并填充SQL编译缓存),默认False
         **kwargs: 当session_provider为None时,传递给create_session_provider的其他参数
 
     Returns:
@@ -147,10 +151,15 @@ def create_repository[T](
         >>> user_repo = create_repository(User, session_provider=provider)
         >>> # 指定数据库键
         >>> user_repo = create_repository(User, db_key='mysql_db')
+        >>> # 启动时预热
+        >>> user_repo = create_repository(User, warm_up=True)
     """
     if session_provider is None:
         session_provider = create_session_provider(db_key=db_key, **kwargs)
-    return Repository(model, session_provider)
+    repository = Repository(model, session_provider)
+    if warm_up:
+        repository.warm_up()
+    return repository
 
 
 def create_orm_operations[T](
@@ -159,6 +168,10 @@ def create_orm_operations[T](
     validator_model: Any | None = None,
     cache_enabled: bool = True,
     db_key: str = 'default',
+    *,
+    load_options: list[Any] | None = None,
+    strict_loading: bool = False,
+    cache_ttl: float | None = None,
     **kwargs: Any,
 ) -> OrmOperations[T]:
     """创建ORM操作对象
@@ -174,6 +187,9 @@ def create_orm_operations[T](
         validator_model: Pydantic验证模型(可选)
         cache_enabled: 是否启用查询缓存,默认True
         db_key: 当session_provider为None时,用于创建SessionProvider的数据库配置键
+        load_options: 应用于所有查询的加载选项,如[selectinload(User.orders)](仅限关键字)
+        strict_loading: 是否追加raiseload('*')禁止意外的延迟加载,默认False(仅限关键字)
+        cache_ttl: 缓存条目有效期(秒),None表示不过期(仅限关键字)
         **kwargs: 当session_provider为None时,传递给create_session_provider的其他参数
 
     Returns:
@@ -201,6 +217,9 @@ def create_orm_operations[T](
         session_provider,
         validator_model=validator_model,
         cache_enabled=cache_enabled,
+        load_options=load_options,
+        strict_loading=strict_loading,
+        cache_ttl=cache_ttl,
     )
 
 
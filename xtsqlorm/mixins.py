@@ -17,10 +17,11 @@ Github       : https://github.com/sandorn/xtsqlorm
 
 from __future__ import annotations
 
+from collections.abc import Iterable
 from datetime import UTC, datetime, timedelta
 from typing import Any
 
-from sqlalchemy import DateTime, Integer, delete, select, text
+from sqlalchemy import DateTime, Integer, delete, select, text, update
 from sqlalchemy.orm import Mapped, mapped_column
 
 # ============ 异常定义 ============
@@ -224,5 +225,30 @@ class VersionedMixin:
         """
         self.version += 1
 
+    @classmethod
+    def bulk_increment_version(cls, session: Any, ids: Iterable[Any]) -> int:
+        """批量增加多条记录的版本号
+
+        以单条 UPDATE ... SET version = version + 1 WHERE id IN (...) 完成,
+        避免逐个加载对象并调用increment_version()。不提交事务,由调用方控制。
+
+        Args:
+            session: SQLAlchemy会话对象
+            ids: 要增加版本号的记录ID集合
+
+        Returns:
+            int: 受影响的记录数量
+
+        Example:
+            >>> with provider.transaction() as session:
+            ...     Article.bulk_increment_version(session, [1, 2, 3])
+        """
+        id_list = list(ids)
+        if not id_list:
+            return 0
+
+        result = session.execute(update(cls).where(cls.id.in_(id_list)).values(version=cls.version + 1))  # type: ignore[attr-defined]
+        return result.rowcount
+
 
 __all__ = ['IdMixin', 'SoftDeleteMixin', 'TimestampMixin', 'UTCTimeMixin', 'VersionedMixin']
@@ -28,20 +28,32 @@ Github       : https://github.com/sandorn/xtsqlorm
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any, Literal
+import time
+from collections.abc import Iterator, Sequence
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Literal, overload
 
 import pandas as pd
 from pydantic import BaseModel as PydanticModel, ValidationError
-from sqlalchemy import and_, func, or_, text
-from sqlalchemy.orm import Query
+from sqlalchemy import Select, and_, func, insert, inspect, or_, select, text, update
+from sqlalchemy.orm import Query, Session, raiseload
+from sqlalchemy.sql.elements import TextClause
 from xtlog import mylog as log
 
+from .async_repository import AsyncRepository
 from .protocols import IAsyncSessionProvider, ISessionProvider
 from .repository import Repository
 
 if TYPE_CHECKING:
     pass
 
+
+@lru_cache(maxsize=256)
+def _text_clause(sql: str) -> TextClause:
+    """获取SQL字符串对应的TextClause(按SQL文本缓存,避免重复构建和编译)"""
+    return text(sql)
+
+
 # ============ 同步操作类 ============
 
 
@@ -72,6 +84,11 @@ class OrmOperations[T](Repository[T]):
         >>> page_data, total = ops.get_paginated(page=1, page_size=10)
         >>> stats = ops.get_field_stats('age')
         >>> df = ops.export_to_dataframe()
+        >>> # 在测试中断言查询次数,防止N+1回归
+        >>> from xtsqlorm import count_queries
+        >>> with count_queries(conn_mgr.engine) as queries:
+        ...     ops.get_all()
+        >>> assert len(queries) == 1
     """
 
     def __init__(
@@ -80,6 +97,9 @@ class OrmOperations[T](Repository[T]):
         session_provider: ISessionProvider,
         validator_model: type[PydanticModel] | None = None,
         cache_enabled: bool = True,
+        load_options: list[Any] | None = None,
+        strict_loading: bool = False,
+        cache_ttl: float | None = None,
     ):
         """初始化ORM操作类
 
@@ -88,11 +108,23 @@ class OrmOperations[T](Repository[T]):
             session_provider: 会话提供者(实现ISessionProvider接口)
             validator_model: Pydantic验证模型(可选)
             cache_enabled: 是否启用查询缓存,默认True
+            load_options: 应用于所有查询的加载选项,如[selectinload(User.orders)],避免N+1查询
+            strict_loading: 是否追加raiseload('*'),意外的延迟加载将直接抛出异常,默认False
+            cache_ttl: 缓存条目有效期(秒),None表示不过期,默认None
+
+        Example:
+            >>> from sqlalchemy.orm import selectinload
+            >>> ops = OrmOperations(User, provider, load_options=[selectinload(User.orders)], strict_loading=True)
         """
         super().__init__(model, session_provider)
         self._validator_model = validator_model
         self._cache_enabled = cache_enabled
-        self._query_cache: dict[str, Any] = {}
+        self._cache_ttl = cache_ttl
+        # 缓存条目: 键 -> (过期时间戳, 值),过期时间戳为None表示不过期
+        self._query_cache: dict[str, tuple[float | None, Any]] = {}
+        self._load_options: list[Any] = list(load_options or [])
+        if strict_loading:
+            self._load_options.append(raiseload('*'))
         log.success(f'OrmOperations[{self._model_name}] | ORM操作对象已初始化')
 
     # ============ 数据验证 ============
@@ -111,13 +143,38 @@ class OrmOperations[T](Repository[T]):
         """
         if self._validator_model:
             try:
-                validated_data = self._validator_model(**data_dict)
-                return validated_data.dict(exclude_unset=True)
+                validated_data = self._validator_model.model_validate(data_dict)
+                return validated_data.model_dump(exclude_unset=True)
             except ValidationError as e:
                 log.error(f'OrmOperations[{self._model_name}] | 数据验证失败: {e}')
                 raise ValueError(f'数据验证失败: {e}') from e
         return data_dict
 
+    def _select(self) -> Select:
+        """构建应用了加载选项的基础select()语句
+
+        Returns:
+            Select: SQLAlchemy 2.0 Select对象
+        """
+        stmt = select(self._model)
+        if self._load_options:
+            stmt = stmt.options(*self._load_options)
+        return stmt
+
+    def _query(self, session: Session) -> Query:
+        """构建应用了加载选项的基础查询(旧版Query API,仅用于advanced_query兼容)
+
+        Args:
+            session: 数据库会话对象
+
+        Returns:
+            Query: SQLAlchemy Query对象
+        """
+        query = session.query(self._model)
+        if self._load_options:
+            query = query.options(*self._load_options)
+        return query
+
     # ============ 缓存管理 ============
 
     def clear_cache(self) -> None:
@@ -132,30 +189,93 @@ class OrmOperations[T](Repository[T]):
         self._query_cache.clear()
         log.debug(f'OrmOperations[{self._model_name}] | 缓存已清空')
 
+    def _cache_get(self, cache_key: str) -> Any | None:
+        """读取缓存条目,已过期的条目会被移除
+
+        Args:
+            cache_key: 缓存键
+
+        Returns:
+            Any | None: 缓存值,未命中或已过期返回None
+        """
+        entry = self._query_cache.get(cache_key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at is not None and expires_at <= time.monotonic():
+            self._query_cache.pop(cache_key, None)
+            return None
+        return value
+
+    def _cache_set(self, cache_key: str, value: Any) -> None:
+        """写入缓存条目
+
+        Args:
+            cache_key: 缓存键
+            value: 缓存值
+        """
+        expires_at = time.monotonic() + self._cache_ttl if self._cache_ttl is not None else None
+        self._query_cache[cache_key] = (expires_at, value)
+
+    def invalidate_cache(self, id_value: int) -> None:
+        """移除指定ID的缓存条目
+
+        Args:
+            id_value: 记录ID
+
+        Example:
+            >>> ops.invalidate_cache(1)
+        """
+        self._query_cache.pop(f'id_{id_value}', None)
+
     # ============ 重写基础CRUD方法(添加缓存和验证)============
 
-    def get_by_id(self, id_value: int) -> T | None:
+    def get_by_id(self, id_value: int, *, populate_existing: bool = False, only: list[str] | None = None) -> T | None:
         """根据ID获取记录(带缓存)
 
         重写Repository的方法,添加缓存支持。
+        当前线程已持有ScopedSession时直接复用该session,
+        记录已在identity map中时无需再访问数据库。
+        注意: 此时返回的对象仍附着在该ScopedSession上(可延迟加载关系,随session提交/关闭而过期),
+        且不写入查询缓存;其他路径返回的都是已分离(expunge)的对象。
 
         Args:
             id_value: 记录ID
+            populate_existing: 复用ScopedSession时是否强制从数据库重新加载,默认False
+            only: 只加载这些列,None表示加载全部列;部分加载的对象不写入缓存
 
         Returns:
             T | None: 查询到的模型对象,不存在则返回None
         """
         if self._cache_enabled:
             cache_key = f'id_{id_value}'
-            if cache_key in self._query_cache:
+            cached = self._cache_get(cache_key)
+            if cached is not None:
                 log.debug(f'OrmOperations[{self._model_name}] | 从缓存获取: {cache_key}')
-                return self._query_cache[cache_key]
-
-        result = super().get_by_id(id_value)
+                return cached
+
+        if only:
+            with self._session_provider.transaction() as session:
+                result = session.get(self._model, id_value, options=[*self._load_options, self._load_only(only)])
+                if result:
+                    session.expunge(result)
+            return result
+
+        # 复用当前线程的ScopedSession,避免新建事务(返回的对象仍附着在该session上,且不写入缓存)
+        if self._session_provider.has_scoped_session():
+            session = self._session_provider.create_scoped_session()
+            return session.get(self._model, id_value, options=self._load_options, populate_existing=populate_existing)
+
+        if self._load_options:
+            with self._session_provider.transaction() as session:
+                result = session.get(self._model, id_value, options=self._load_options)
+                if result:
+                    session.expunge(result)
+        else:
+            result = super().get_by_id(id_value)
 
         if self._cache_enabled and result:
-            cache_key = f'id_{id_value}'
-            self._query_cache[cache_key] = result
+            self._cache_set(f'id_{id_value}', result)
 
         return result
 
@@ -181,7 +301,7 @@ class OrmOperations[T](Repository[T]):
     def update(self, id_value: int, data: dict[str, Any]) -> T | None:
         """更新记录(带验证)
 
-        重写Repository的方法,添加数据验证和缓存清理。
+        重写Repository的方法,添加数据验证,并移除该记录的缓存。
 
         Args:
             id_value: 记录ID
@@ -194,14 +314,14 @@ class OrmOperations[T](Repository[T]):
         result = super().update(id_value, validated_data)
 
         if self._cache_enabled:
-            self.clear_cache()
+            self.invalidate_cache(id_value)
 
         return result
 
     def delete(self, id_value: int) -> bool:
         """删除记录(带缓存清理)
 
-        重写Repository的方法,添加缓存清理。
+        重写Repository的方法,并移除该记录的缓存。
 
         Args:
             id_value: 记录ID
@@ -212,7 +332,7 @@ class OrmOperations[T](Repository[T]):
         result = super().delete(id_value)
 
         if self._cache_enabled and result:
-            self.clear_cache()
+            self.invalidate_cache(id_value)
 
         return result
 
@@ -230,16 +350,48 @@ class OrmOperations[T](Repository[T]):
         Example:
             >>> user = ops.get_one({'email': 'alice@example.com'})
         """
+        stmt = self._select()
+        if where_dict:
+            stmt = stmt.filter_by(**where_dict)
+
         with self._session_provider.transaction() as session:
-            query = session.query(self._model)
-            if where_dict:
-                query = query.filter_by(**where_dict)
-            instance = query.first()
+            instance = session.scalars(stmt.limit(1)).first()
             if instance:
-                session.refresh(instance)
                 session.expunge(instance)
             return instance
 
+    def get_one_matching_any(self, where_dict: dict[str, Any]) -> tuple[T | None, set[str]]:
+        """获取满足任一条件的单条记录,并返回命中的字段
+
+        将多次按单字段探测合并为一条 WHERE a=? OR b=? 查询,只需一次数据库往返。
+
+        Args:
+            where_dict: 查询条件字典,各条件之间为OR关系
+
+        Returns:
+            tuple[T | None, set[str]]: (查询到的模型对象, 与记录值相等的字段名集合),
+                无匹配记录时返回 (None, set())
+
+        Example:
+            >>> user, matched = ops.get_one_matching_any({'username': 'alice', 'email': 'alice@example.com'})
+            >>> if 'email' in matched:
+            ...     print('邮箱已被注册')
+        """
+        if not where_dict:
+            return None, set()
+
+        conditions = [getattr(self._model, key) == value for key, value in where_dict.items()]
+        stmt = self._select().where(or_(*conditions)).limit(1)
+
+        with self._session_provider.transaction() as session:
+            instance = session.scalars(stmt).first()
+            if instance is None:
+                return None, set()
+            session.expunge(instance)
+
+        matched = {key for key, value in where_dict.items() if getattr(instance, key) == value}
+        return instance, matched
+
     def get_paginated(
         self,
         page: int = 1,
@@ -260,35 +412,142 @@ class OrmOperations[T](Repository[T]):
         Returns:
             tuple: (查询到的模型对象列表, 总记录数)
 
+        Note:
+            OFFSET分页在深页时需扫描并丢弃前面所有行,且每次都执行COUNT(*);
+            大表顺序翻页推荐使用 get_keyset()
+
         Example:
             >>> results, total = ops.get_paginated(page=1, page_size=10, where_dict={'status': 'active'}, order_by='created_at', order_dir='desc')
             >>> print(f'第1页: {len(results)}条, 总共: {total}条')
         """
-        with self._session_provider.transaction() as session:
-            # 构建基础查询
-            query = session.query(self._model)
-            if where_dict:
-                query = query.filter_by(**where_dict)
+        stmt, count_stmt = self._paginate(self._select(), page, page_size, where_dict, order_by, order_dir)
 
+        with self._session_provider.transaction() as session:
             # 计算总记录数
-            total_count = query.count()
-
-            # 排序
-            if order_by:
-                order_field = getattr(self._model, order_by)
-                query = query.order_by(order_field.desc()) if order_dir == 'desc' else query.order_by(order_field)
-
-            # 分页
-            offset = (page - 1) * page_size
-            result = query.offset(offset).limit(page_size).all()
+            total_count = session.scalar(count_stmt) or 0
+            result = list(session.scalars(stmt))
 
             # 分离对象，允许在事务外访问
             for instance in result:
-                session.refresh(instance)
                 session.expunge(instance)
 
             return result, total_count
 
+    def get_paginated_columns(
+        self,
+        columns: Sequence[str],
+        page: int = 1,
+        page_size: int = 10,
+        where_dict: dict[str, Any] | None = None,
+        order_by: str | None = None,
+        order_dir: Literal['asc', 'desc'] = 'asc',
+    ) -> tuple[list[dict[str, Any]], int]:
+        """分页查询指定列,返回字典列表
+
+        只查询需要的列,不构造ORM对象(无身份映射和实例状态开销),
+        适用于列表接口等只读展示场景。
+
+        Args:
+            columns: 要查询的列名列表
+            page: 页码,从1开始
+            page_size: 每页记录数
+            where_dict: 查询条件字典
+            order_by: 排序字段名
+            order_dir: 排序方向,'asc'或'desc'
+
+        Returns:
+            tuple: (列名到值的字典列表, 总记录数)
+
+        Example:
+            >>> rows, total = ops.get_paginated_columns(['id', 'username'], page=1, page_size=50, order_by='id')
+            >>> print(rows[0]['username'])
+        """
+        base = select(*[getattr(self._model, col) for col in columns])
+        stmt, count_stmt = self._paginate(base, page, page_size, where_dict, order_by, order_dir)
+
+        with self._session_provider.transaction() as session:
+            total_count = session.scalar(count_stmt) or 0
+            rows = [dict(row) for row in session.execute(stmt).mappings()]
+            return rows, total_count
+
+    def _paginate(
+        self,
+        stmt: Select,
+        page: int,
+        page_size: int,
+        where_dict: dict[str, Any] | None,
+        order_by: str | None,
+        order_dir: Literal['asc', 'desc'],
+    ) -> tuple[Select, Select]:
+        """为查询附加过滤、排序和OFFSET分页,并构建对应的COUNT语句
+
+        Args:
+            stmt: 基础查询
+            page: 页码,从1开始
+            page_size: 每页记录数
+            where_dict: 查询条件字典
+            order_by: 排序字段名
+            order_dir: 排序方向,'asc'或'desc'
+
+        Returns:
+            tuple[Select, Select]: (分页查询, COUNT查询)
+        """
+        count_stmt = select(func.count()).select_from(self._model)
+        if where_dict:
+            stmt = stmt.filter_by(**where_dict)
+            count_stmt = count_stmt.filter_by(**where_dict)
+
+        # 排序
+        if order_by:
+            order_field = getattr(self._model, order_by)
+            stmt = stmt.order_by(order_field.desc() if order_dir == 'desc' else order_field)
+
+        # 分页
+        offset = (page - 1) * page_size
+        return stmt.offset(offset).limit(page_size), count_stmt
+
+    def get_keyset(
+        self,
+        after_id: Any | None = None,
+        limit: int = 10,
+        order_by: str = 'id',
+        where_dict: dict[str, Any] | None = None,
+    ) -> list[T]:
+        """键集(keyset)分页查询记录
+
+        以上一页最后一条记录的排序字段值为游标,生成
+        WHERE order_col > :after ORDER BY order_col LIMIT n,
+        每页只扫描limit行,且不需要COUNT(*)。
+
+        Args:
+            after_id: 上一页最后一条记录的排序字段值,None表示第一页
+            limit: 每页记录数
+            order_by: 排序字段名,应为唯一且有索引的字段,默认'id'
+            where_dict: 查询条件字典
+
+        Returns:
+            list[T]: 查询到的模型对象列表
+
+        Example:
+            >>> page = ops.get_keyset(limit=100)
+            >>> while page:
+            ...     process(page)
+            ...     page = ops.get_keyset(after_id=page[-1].id, limit=100)
+        """
+        order_field = getattr(self._model, order_by)
+        stmt = self._select()
+        if where_dict:
+            stmt = stmt.filter_by(**where_dict)
+        if after_id is not None:
+            stmt = stmt.where(order_field > after_id)
+        stmt = stmt.order_by(order_field).limit(limit)
+
+        with self._session_provider.transaction() as session:
+            results = list(session.scalars(stmt))
+            for instance in results:
+                session.expunge(instance)
+            return results
+
     def advanced_query(
         self,
         filters: list[Any] | None = None,
@@ -313,7 +572,7 @@ class OrmOperations[T](Repository[T]):
             >>> results = query.all()
         """
         with self._session_provider.transaction() as session:
-            query = session.query(self._model)
+            query = self._query(session)
 
             if filters:
                 query = query.filter(*filters)
@@ -344,60 +603,80 @@ class OrmOperations[T](Repository[T]):
             >>> # 查询: (name='Alice' AND age=25) OR (name='Bob' AND age=30)
             >>> results = ops.filter_by_conditions([{'name': 'Alice', 'age': 25}, {'name': 'Bob', 'age': 30}])
         """
-        with self._session_provider.transaction() as session:
-            query = session.query(self._model)
+        stmt = self._select()
 
-            if conditions:
-                or_conditions = []
-                for condition in conditions:
-                    and_conditions = []
-                    for key, value in condition.items():
-                        and_conditions.append(getattr(self._model, key) == value)
-                    if and_conditions:
-                        or_conditions.append(and_(*and_conditions))
+        if conditions:
+            or_conditions = []
+            for condition in conditions:
+                and_conditions = []
+                for key, value in condition.items():
+                    and_conditions.append(getattr(self._model, key) == value)
+                if and_conditions:
+                    or_conditions.append(and_(*and_conditions))
 
-                if or_conditions:
-                    query = query.filter(or_(*or_conditions))
+            if or_conditions:
+                stmt = stmt.where(or_(*or_conditions))
 
-            if limit is not None:
-                query = query.limit(limit)
+        if limit is not None:
+            stmt = stmt.limit(limit)
 
-            results = query.all()
+        with self._session_provider.transaction() as session:
+            results = list(session.scalars(stmt))
 
             # 分离对象，允许在事务外访问
             for instance in results:
-                session.refresh(instance)
                 session.expunge(instance)
 
             return results
 
     # ============ 批量操作 ============
 
-    def bulk_create(self, data_list: list[dict[str, Any]]) -> list[T]:
+    def bulk_create(self, data_list: list[dict[str, Any]], *, return_instances: bool = True) -> list[T]:
         """批量创建记录
 
         Args:
             data_list: 记录数据字典列表
+            return_instances: 是否返回创建的模型对象,默认True;
+                为False时以ORM批量INSERT(executemany)写入,跳过实例构建与身份映射,返回空列表
 
         Returns:
-            list[T]: 创建的模型对象列表
+            list[T]: 创建的模型对象列表(return_instances=False时为空列表)
+
+        Note:
+            数据库支持executemany RETURNING时(PostgreSQL/SQLite/MariaDB),
+            使用单条批量INSERT ... RETURNING一次性写入并取回实例;
+            否则回退为逐个实例flush + refresh。
 
         Example:
             >>> users = ops.bulk_create([{'name': 'Alice', 'age': 25}, {'name': 'Bob', 'age': 30}])
+            >>> ops.bulk_create(large_data_list, return_instances=False)  # 纯写入,速度最快
         """
-        with self._session_provider.transaction() as session:
-            # 验证数据并创建实例
-            validated_data_list = [self._validate_data(data) for data in data_list]
-            instances = [self._model(**data) for data in validated_data_list]
+        # 验证数据
+        validated_data_list = [self._validate_data(data) for data in data_list]
+        if not validated_data_list:
+            return []
 
-            # 批量添加
-            session.add_all(instances)
-            session.flush()
+        with self._session_provider.transaction() as session:
+            if not return_instances:
+                # 批量INSERT,不构建ORM实例
+                session.execute(insert(self._model), validated_data_list)
+                instances = []
+            elif session.get_bind().dialect.insert_executemany_returning:
+                # 批量INSERT ... RETURNING,O(1)次往返
+                stmt = insert(self._model).returning(self._model, sort_by_parameter_order=True)
+                instances = list(session.scalars(stmt, validated_data_list))
+                for instance in instances:
+                    session.expunge(instance)
+            else:
+                # 批量添加
+                instances = [self._model(**data) for data in validated_data_list]
+                session.add_all(instances)
+                session.flush()
 
-            # 刷新并分离实例
-            for instance in instances:
-                session.refresh(instance)
-                session.expunge(instance)
+                # 刷新并分离实例
+                for instance in instances:
+                    session.refresh(instance)
+                    session.expunge(instance)
 
             if self._cache_enabled:
                 self.clear_cache()
@@ -452,24 +731,40 @@ class OrmOperations[T](Repository[T]):
         Returns:
             int: 更新的记录数量
 
+        Note:
+            id_key为模型主键时,先用一条IN查询过滤不存在的记录,
+            再以ORM批量UPDATE(executemany)一次提交;否则逐条加载并更新。
+
         Example:
             >>> count = ops.bulk_update([{'id': 1, 'name': 'Alice Updated'}, {'id': 2, 'name': 'Bob Updated'}])
         """
+        rows = [data for data in data_list if id_key in data]
+        if not rows:
+            return 0
+
+        mapper = inspect(self._model)
+        pk_keys = [mapper.get_property_by_column(column).key for column in mapper.primary_key]
         updated_count = 0
 
         with self._session_provider.transaction() as session:
-            for data in data_list:
-                if id_key not in data:
-                    continue
-
-                id_value = data[id_key]
-                update_data = {k: v for k, v in data.items() if k != id_key}
+            if pk_keys == [id_key]:
+                # 按主键批量更新,跳过不存在的记录
+                id_column = getattr(self._model, id_key)
+                existing_ids = set(session.scalars(select(id_column).where(id_column.in_({data[id_key] for data in rows}))))
+                rows = [data for data in rows if data[id_key] in existing_ids]
+                if rows:
+                    session.execute(update(self._model), rows)
+                updated_count = len(rows)
+            else:
+                for data in rows:
+                    id_value = data[id_key]
+                    update_data = {k: v for k, v in data.items() if k != id_key}
 
-                instance = session.get(self._model, id_value)
-                if instance:
-                    for key, value in update_data.items():
-                        setattr(instance, key, value)
-                    updated_count += 1
+                    instance = session.get(self._model, id_value)
+                    if instance:
+                        for key, value in update_data.items():
+                            setattr(instance, key, value)
+                        updated_count += 1
 
         if self._cache_enabled and updated_count > 0:
             self.clear_cache()
@@ -503,37 +798,109 @@ class OrmOperations[T](Repository[T]):
                 'avg': float(stats[3]) if stats and len(stats) > 3 and stats[3] else 0.0,
             }
 
+    def aggregate(self, expressions: dict[str, Any]) -> dict[str, Any]:
+        """在一条SELECT中计算多个聚合表达式
+
+        将多次统计查询合并为一次数据库往返。
+
+        Args:
+            expressions: {结果键: SQLAlchemy聚合表达式} 字典
+
+        Returns:
+            dict[str, Any]: {结果键: 聚合结果}
+
+        Example:
+            >>> stats = ops.aggregate({
+            ...     'total': func.count(),
+            ...     'active': func.count(case((User.is_active.is_(True), 1))),
+            ...     'avg_age': func.avg(User.age),
+            ... })
+            >>> print(stats['total'], stats['active'], stats['avg_age'])
+        """
+        stmt = select(*[expr.label(key) for key, expr in expressions.items()]).select_from(self._model)
+        with self._session_provider.transaction() as session:
+            return dict(session.execute(stmt).one()._mapping)
+
     # ============ 数据导出 ============
 
+    @overload
     def export_to_dataframe(
         self,
         columns: list[str] | None = None,
         filters: list[Any] | None = None,
+        batch_size: int = 1000,
+        chunksize: None = None,
     ) -> pd.DataFrame:
+        """一次性导出(chunksize 为 None)"""
+        ...
+
+    @overload
+    def export_to_dataframe(
+        self,
+        columns: list[str] | None = None,
+        filters: list[Any] | None = None,
+        batch_size: int = 1000,
+        *,
+        chunksize: int,
+    ) -> Iterator[pd.DataFrame]:
+        """分块导出(chunksize 为 int)"""
+        ...
+
+    def export_to_dataframe(
+        self,
+        columns: list[str] | None = None,
+        filters: list[Any] | None = None,
+        batch_size: int = 1000,
+        chunksize: int | None = None,
+    ) -> pd.DataFrame | Iterator[pd.DataFrame]:
         """导出到Pandas DataFrame
 
+        使用服务端游标(stream_results)按批次读取行数据,
+        不创建ORM对象,避免驱动一次性缓冲整个结果集。
+
         Args:
             columns: 要导出的列名列表,None表示导出所有列
             filters: SQLAlchemy过滤条件列表
+            batch_size: 每批读取的行数,默认1000
+            chunksize: 指定时改为返回DataFrame迭代器(pandas.read_sql_query),
+                每块最多chunksize行,事务在迭代结束后关闭
 
         Returns:
-            pd.DataFrame: Pandas DataFrame对象
+            pd.DataFrame | Iterator[pd.DataFrame]: DataFrame对象,指定chunksize时为DataFrame迭代器
 
         Example:
             >>> df = ops.export_to_dataframe(columns=['name', 'age'], filters=[User.age > 18])
             >>> df.to_csv('users.csv')
+            >>> # 分块导出大表
+            >>> for chunk in ops.export_to_dataframe(chunksize=10_000):
+            ...     chunk.to_csv('users.csv', mode='a', header=False)
         """
+        stmt = select(*[getattr(self._model, col) for col in columns]) if columns else select(*self._model.__table__.columns)  # type: ignore[attr-defined]
+
+        if filters:
+            stmt = stmt.where(*filters)
+
+        if chunksize:
+            return self._iter_dataframe_chunks(stmt, chunksize)
+
         with self._session_provider.transaction() as session:
-            if columns:
-                query_columns = [getattr(self._model, col) for col in columns]
-                query = session.query(*query_columns)
-            else:
-                query = session.query(self._model)
+            result = session.execute(stmt.execution_options(stream_results=True, yield_per=batch_size))
+            rows = [row for partition in result.partitions() for row in partition]
+            return pd.DataFrame.from_records(rows, columns=list(result.keys()))
 
-            if filters:
-                query = query.filter(*filters)
+    def _iter_dataframe_chunks(self, stmt: Select, chunksize: int) -> Iterator[pd.DataFrame]:
+        """在同一事务中以服务端游标分块读取查询结果
 
-            return pd.read_sql(query.statement, session.bind)
+        Args:
+            stmt: 要执行的select()语句
+            chunksize: 每块行数
+
+        Yields:
+            pd.DataFrame: 每块数据
+        """
+        with self._session_provider.transaction() as session:
+            connection = session.connection(execution_options={'stream_results': True})
+            yield from pd.read_sql_query(stmt, connection, chunksize=chunksize)
 
     def pd_get_dict(self) -> list[dict[str, Any]] | bool:
         """使用Pandas读取表数据并返回字典列表
@@ -611,7 +978,60 @@ class OrmOperations[T](Repository[T]):
             >>> result = ops.execute_raw_sql('SELECT * FROM users WHERE age > :age', {'age': 18})
         """
         with self._session_provider.transaction() as session:
-            return session.execute(text(sql), params or {})
+            return session.execute(_text_clause(sql), params or {})
+
+    def execute_scalar_raw_sql(
+        self,
+        sql: str,
+        params: dict[str, Any] | None = None,
+    ) -> Any:
+        """执行原生SQL语句并返回第一行第一列的值
+
+        适用于COUNT等单值查询,省去Result对象和fetchone()的元组解包。
+
+        Args:
+            sql: SQL查询语句
+            params: SQL参数绑定
+
+        Returns:
+            Any: 第一行第一列的值,无结果时返回None
+
+        Example:
+            >>> total = ops.execute_scalar_raw_sql('SELECT COUNT(*) FROM users WHERE age > :age', {'age': 18})
+        """
+        with self._session_provider.transaction() as session:
+            return session.scalar(_text_clause(sql), params or {})
+
+    def execute_many_raw_sql(
+        self,
+        sql: str,
+        params_list: list[dict[str, Any]],
+    ) -> int:
+        """以executemany方式批量执行同一条原生SQL语句
+
+        适用于以不同参数重复执行同一条INSERT/UPDATE/DELETE的场景,
+        语句只编译一次,由DBAPI的executemany一次性提交全部参数,
+        替代循环调用execute_raw_sql。
+
+        Args:
+            sql: SQL语句(不应为SELECT,executemany不返回结果行)
+            params_list: SQL参数绑定列表,每个字典对应一次执行
+
+        Returns:
+            int: 受影响的行数(驱动不支持时可能为-1)
+
+        Example:
+            >>> count = ops.execute_many_raw_sql(
+            ...     'UPDATE users SET age = :age WHERE id = :id',
+            ...     [{'id': 1, 'age': 26}, {'id': 2, 'age': 31}],
+            ... )
+        """
+        if not params_list:
+            return 0
+
+        with self._session_provider.transaction() as session:
+            result = session.execute(_text_clause(sql), params_list)
+            return result.rowcount  # type: ignore[attr-defined]
 
     def from_statement(
         self,
@@ -631,7 +1051,7 @@ class OrmOperations[T](Repository[T]):
             >>> users = ops.from_statement('SELECT * FROM users WHERE age > :age', {'age': 18})
         """
         with self._session_provider.transaction() as session:
-            sql_text = text(sql)
+            sql_text = _text_clause(sql)
             query = session.query(self._model).from_statement(sql_text)  # type: ignore[arg-type]
 
             results = query.params(**params).all() if params else query.all()
@@ -714,6 +1134,9 @@ class AsyncOrmOperations[T]:
         self._validator_model = validator_model
         self._cache_enabled = cache_enabled
         self._query_cache: dict[str, Any] = {}
+
+        # 组合AsyncRepository(复用同一实例,避免每次调用重复创建)
+        self._repository = AsyncRepository(model, session_provider)
         log.success(f'AsyncOrmOperations[{self._model_name}] | 异步ORM操作对象已初始化')
 
     # ============ 数据验证 ============
@@ -732,8 +1155,8 @@ class AsyncOrmOperations[T]:
         """
         if self._validator_model:
             try:
-                validated_data = self._validator_model(**data_dict)
-                return validated_data.dict(exclude_unset=True)
+                validated_data = self._validator_model.model_validate(data_dict)
+                return validated_data.model_dump(exclude_unset=True)
             except ValidationError as e:
                 log.error(f'AsyncOrmOperations[{self._model_name}] | 数据验证失败: {e}')
                 raise ValueError(f'数据验证失败: {e}') from e
@@ -773,10 +1196,7 @@ class AsyncOrmOperations[T]:
                 return self._query_cache[cache_key]
 
         # 委托给AsyncRepository
-        from .async_repository import AsyncRepository
-
-        repo = AsyncRepository(self._model, self._session_provider)
-        result = await repo.get_by_id(id_value)
+        result = await self._repository.get_by_id(id_value)
 
         if self._cache_enabled and result:
             cache_key = f'id_{id_value}'
@@ -796,11 +1216,7 @@ class AsyncOrmOperations[T]:
             T: 创建的模型对象
         """
         validated_data = self._validate_data(data)
-
-        from .async_repository import AsyncRepository
-
-        repo = AsyncRepository(self._model, self._session_provider)
-        result = await repo.create(validated_data)
+        result = await self._repository.create(validated_data)
 
         if self._cache_enabled:
             self.clear_cache()
@@ -820,11 +1236,7 @@ class AsyncOrmOperations[T]:
             T | None: 更新后的模型对象,不存在则返回None
         """
         validated_data = self._validate_data(data)
-
-        from .async_repository import AsyncRepository
-
-        repo = AsyncRepository(self._model, self._session_provider)
-        result = await repo.update(id_value, validated_data)
+        result = await self._repository.update(id_value, validated_data)
 
         if self._cache_enabled:
             self.clear_cache()
@@ -842,10 +1254,7 @@ class AsyncOrmOperations[T]:
         Returns:
             bool: 删除成功返回True,记录不存在返回False
         """
-        from .async_repository import AsyncRepository
-
-        repo = AsyncRepository(self._model, self._session_provider)
-        result = await repo.delete(id_value)
+        result = await self._repository.delete(id_value)
 
         if self._cache_enabled and result:
             self.clear_cache()
@@ -864,23 +1273,20 @@ class AsyncOrmOperations[T]:
         Returns:
             list[T]: 模型对象列表
         """
-        from .async_repository import AsyncRepository
-
-        repo = AsyncRepository(self._model, self._session_provider)
-        return await repo.get_all(limit=limit, offset=offset)
+        return await self._repository.get_all(limit=limit, offset=offset)
 
-    async def count(self) -> int:
+    async def count(self, where_dict: dict[str, Any] | None = None) -> int:
         """异步统计记录总数
 
         委托给AsyncRepository。
 
+        Args:
+            where_dict: 查询条件字典(可选)
+
         Returns:
-            int: 记录总数
+            int: 符合条件的记录数
         """
-        from .async_repository import AsyncRepository
-
-        repo = AsyncRepository(self._model, self._session_provider)
-        return await repo.count()
+        return await self._repository.count(where_dict)
 
     # ============ 高级异步查询方法 ============
 
@@ -908,8 +1314,6 @@ class AsyncOrmOperations[T]:
             >>> results, total = await async_ops.get_paginated(page=1, page_size=10, where_dict={'status': 'active'}, order_by='created_at', order_dir='desc')
             >>> print(f'第1页: {len(results)}条, 总共: {total}条')
         """
-        from sqlalchemy import select
-
         async with self._session_provider.transaction() as session:
             # 构建基础查询
             stmt = select(self._model)
@@ -990,8 +1394,6 @@ class AsyncOrmOperations[T]:
             >>> stats = await async_ops.get_field_stats('age')
             >>> print(f'平均年龄: {stats["avg"]}')
         """
-        from sqlalchemy import select
-
         async with self._session_provider.transaction() as session:
             field = getattr(self._model, field_name)
 
@@ -1012,6 +1414,23 @@ class AsyncOrmOperations[T]:
                 'avg': float(stats[3]) if stats and len(stats) > 3 and stats[3] else 0.0,
             }
 
+    async def aggregate(self, expressions: dict[str, Any]) -> dict[str, Any]:
+        """异步在一条SELECT中计算多个聚合表达式
+
+        Args:
+            expressions: {结果键: SQLAlchemy聚合表达式} 字典
+
+        Returns:
+            dict[str, Any]: {结果键: 聚合结果}
+
+        Example:
+            >>> stats = await async_ops.aggregate({'total': func.count(), 'avg_age': func.avg(User.age)})
+        """
+        stmt = select(*[expr.label(key) for key, expr in expressions.items()]).select_from(self._model)
+        async with self._session_provider.transaction() as session:
+            result = await session.execute(stmt)
+            return dict(result.one()._mapping)
+
     # ============ 数据导出 ============
 
     async def export_to_dataframe(
@@ -1032,29 +1451,15 @@ class AsyncOrmOperations[T]:
             >>> df = await async_ops.export_to_dataframe(columns=['name', 'age'], filters=[User.age > 18])
             >>> df.to_csv('users.csv')
         """
-        from sqlalchemy import select
+        # 未指定列时直接查询表的所有列,不创建ORM对象
+        stmt = select(*[getattr(self._model, col) for col in columns]) if columns else select(*self._model.__table__.columns)  # type: ignore[attr-defined]
 
-        async with self._session_provider.transaction() as session:
-            if columns:
-                query_columns = [getattr(self._model, col) for col in columns]
-                stmt = select(*query_columns)
-            else:
-                stmt = select(self._model)
-
-            if filters:
-                stmt = stmt.where(*filters)
+        if filters:
+            stmt = stmt.where(*filters)
 
-            # 执行查询并转换为DataFrame
+        async with self._session_provider.transaction() as session:
             result = await session.execute(stmt)
-            data = result.fetchall()
-
-            # 构建DataFrame
-            if columns:
-                # 将数据转换为列表格式
-                return pd.DataFrame([list(row) for row in data], columns=columns)  # type: ignore[arg-type]
-
-            # 如果没有指定列,使用模型的所有列
-            return pd.DataFrame([row._asdict() if hasattr(row, '_asdict') else dict(row._mapping) for row in data])
+            return pd.DataFrame.from_records(result.all(), columns=list(result.keys()))
 
     # ============ 原生SQL执行 ============
 
@@ -1076,7 +1481,7 @@ class AsyncOrmOperations[T]:
             >>> result = await async_ops.execute_raw_sql('SELECT * FROM users WHERE age > :age', {'age': 18})
         """
         async with self._session_provider.transaction() as session:
-            return await session.execute(text(sql), params or {})
+            return await session.execute(_text_clause(sql), params or {})
 
 
 __all__ = ['AsyncOrmOperations', 'OrmOperations']
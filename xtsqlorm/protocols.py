@@ -116,6 +116,27 @@ class ISessionProvider(ABC):
         """
         pass
 
+    def create_scoped_session(self) -> Session:
+        """获取当前线程的ScopedSession
+
+        Returns:
+            Session: 当前线程的Session对象
+
+        Raises:
+            NotImplementedError: 实现类不支持ScopedSession时
+        """
+        raise NotImplementedError(f'{type(self).__name__} 不支持ScopedSession')
+
+    def has_scoped_session(self) -> bool:
+        """当前线程是否已持有ScopedSession
+
+        默认返回False,不支持ScopedSession的实现类无需重写。
+
+        Returns:
+            bool: 已创建返回True,否则返回False
+        """
+        return False
+
 
 class IRepository[T](ABC):
     """仓储接口 - 定义标准CRUD操作
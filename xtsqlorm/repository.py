@@ -21,7 +21,8 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING, Any
 
-from sqlalchemy.orm import Session
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session, configure_mappers, load_only
 from xtlog import mylog as log
 
 from .protocols import IRepository, ISessionProvider
@@ -70,6 +71,8 @@ class Repository[T](IRepository[T]):
         self._model = model
         self._session_provider = session_provider
         self._model_name = model.__name__
+        # 提前完成映射器配置,避免首次查询时才付出configure_mappers()开销(已配置时为空操作)
+        configure_mappers()
         log.success(f'Repository[{self._model_name}] | 仓储已初始化')
 
     def __str__(self) -> str:
@@ -80,13 +83,37 @@ class Repository[T](IRepository[T]):
         """详细表示"""
         return f'Repository(model={self._model_name}, provider={self._session_provider})'
 
+    def warm_up(self) -> None:
+        """预热仓储
+
+        执行一次轻量查询,提前建立连接池连接并填充SQL编译缓存,
+        使首个业务请求不再承担连接与编译开销。
+
+        Example:
+            >>> user_repo.warm_up()
+        """
+        with self._session_provider.transaction() as session:
+            session.execute(select(self._model).limit(1)).all()
+
     # ============ 基础CRUD操作(自动事务管理)============
 
-    def get_by_id(self, id_value: int) -> T | None:
+    def _load_only(self, only: list[str]) -> Any:
+        """构建只加载指定列的加载选项(主键列总会被加载)
+
+        Args:
+            only: 需要加载的列属性名列表
+
+        Returns:
+            Any: load_only加载选项
+        """
+        return load_only(*(getattr(self._model, name) for name in only))
+
+    def get_by_id(self, id_value: int, *, only: list[str] | None = None) -> T | None:
         """根据ID获取记录(自动事务)
 
         Args:
             id_value: 记录ID
+            only: 只加载这些列,None表示加载全部列。返回的对象已分离,访问未加载的列会抛出DetachedInstanceError
 
         Returns:
             T | None: 查询到的模型对象,不存在则返回None
@@ -95,11 +122,17 @@ class Repository[T](IRepository[T]):
             >>> user = user_repo.get_by_id(1)
             >>> if user:
             ...     print(f'找到用户: {user.name}')
+            >>> user = user_repo.get_by_id(1, only=['id', 'name'])  # 不加载其他列
         """
         with self._session_provider.transaction() as session:
-            instance = session.get(self._model, id_value)
+            if only:
+                # load_only查询已取回所需列,无需再refresh
+                instance = session.get(self._model, id_value, options=[self._load_only(only)])
+            else:
+                instance = session.get(self._model, id_value)
+                if instance:
+                    session.refresh(instance)
             if instance:
-                session.refresh(instance)
                 session.expunge(instance)
             return instance
 
@@ -115,12 +148,17 @@ class Repository[T](IRepository[T]):
         Example:
             >>> user = user_repo.create({'name': 'Alice', 'email': 'alice@example.com'})
             >>> print(f'创建用户ID: {user.id}')
+
+        Note:
+            数据库支持INSERT ... RETURNING时,flush已通过RETURNING取回主键和服务端默认值,
+            无需再refresh(省去一次SELECT往返)
         """
         with self._session_provider.transaction() as session:
             instance = self._model(**data)
             session.add(instance)
             session.flush()
-            session.refresh(instance)
+            if not session.get_bind().dialect.insert_returning:
+                session.refresh(instance)
             session.expunge(instance)
             return instance
 
@@ -173,12 +211,14 @@ class Repository[T](IRepository[T]):
 
     # ============ 批量查询操作 ============
 
-    def get_all(self, limit: int | None = None, offset: int | None = None) -> list[T]:
+    def get_all(self, limit: int | None = None, offset: int | None = None, *, only: list[str] | None = None) -> list[T]:
         """获取所有记录
 
         Args:
             limit: 限制返回数量
             offset: 跳过记录数
+            only: 只加载这些列,None表示加载全部列。宽表只需少数列时可减少传输和对象构建开销,
+                返回的对象已分离,访问未加载的列会抛出DetachedInstanceError
 
         Returns:
             list[T]: 模型对象列表
@@ -188,32 +228,63 @@ class Repository[T](IRepository[T]):
             >>> all_users = user_repo.get_all()
             >>> # 分页查询
             >>> page_users = user_repo.get_all(limit=10, offset=20)
+            >>> # 只加载需要的列
+            >>> names = user_repo.get_all(limit=5, only=['id', 'name'])
         """
+        stmt = select(self._model)
+        if only:
+            stmt = stmt.options(self._load_only(only))
+        if offset:
+            stmt = stmt.offset(offset)
+        if limit:
+            stmt = stmt.limit(limit)
+
         with self._session_provider.transaction() as session:
-            query = session.query(self._model)
-            if offset:
-                query = query.offset(offset)
-            if limit:
-                query = query.limit(limit)
-            results = query.all()
+            results = list(session.scalars(stmt))
             # 分离对象，允许在事务外访问
             for instance in results:
-                session.refresh(instance)
                 session.expunge(instance)
             return results
 
-    def count(self) -> int:
-        """统计记录总数
+    def get_many_by_ids(self, ids: list[int]) -> list[T]:
+        """根据ID列表批量获取记录(单条IN查询)
+
+        Args:
+            ids: 记录ID列表
+
+        Returns:
+            list[T]: 查询到的模型对象列表(不存在的ID被忽略,不保证顺序)
+
+        Example:
+            >>> users = user_repo.get_many_by_ids([1, 2, 3])
+        """
+        if not ids:
+            return []
+        with self._session_provider.transaction() as session:
+            results = self.get_many_by_ids_in_session(ids, session)
+            for instance in results:
+                session.expunge(instance)
+            return results
+
+    def count(self, where_dict: dict[str, Any] | None = None) -> int:
+        """统计记录总数(在数据库端执行COUNT)
+
+        Args:
+            where_dict: 查询条件字典(可选)
 
         Returns:
-            int: 记录总数
+            int: 符合条件的记录数
 
         Example:
             >>> total = user_repo.count()
             >>> print(f'共有 {total} 条记录')
+            >>> active = user_repo.count({'is_active': True})
         """
+        stmt = select(func.count()).select_from(self._model)
+        if where_dict:
+            stmt = stmt.filter_by(**where_dict)
         with self._session_provider.transaction() as session:
-            return session.query(self._model).count()
+            return session.scalar(stmt) or 0
 
     def exists(self, id_value: int) -> bool:
         """检查记录是否存在
@@ -228,8 +299,9 @@ class Repository[T](IRepository[T]):
             >>> if user_repo.exists(1):
             ...     print('用户存在')
         """
+        stmt = select(self._model.id).where(self._model.id == id_value).limit(1)  # type: ignore[attr-defined]
         with self._session_provider.transaction() as session:
-            return session.query(self._model).filter(self._model.id == id_value).count() > 0  # type: ignore[attr-defined]
+            return session.scalar(stmt) is not None
 
     # ============ 高级用法: 外部事务管理 ============
 
@@ -253,6 +325,24 @@ class Repository[T](IRepository[T]):
         """
         return session.get(self._model, id_value)
 
+    def get_many_by_ids_in_session(self, ids: list[int], session: Session) -> list[T]:
+        """在指定session中根据ID列表批量获取记录(外部事务)
+
+        使用一条 WHERE id IN (...) 查询代替N次单独查询,
+        查询到的对象会进入session的identity map,后续session.get不再访问数据库。
+
+        Args:
+            ids: 记录ID列表
+            session: 外部提供的Session对象
+
+        Returns:
+            list[T]: 查询到的模型对象列表(不存在的ID被忽略,不保证顺序)
+        """
+        if not ids:
+            return []
+        stmt = select(self._model).where(self._model.id.in_(ids))  # type: ignore[attr-defined]
+        return list(session.scalars(stmt))
+
     def create_in_session(self, data: dict[str, Any], session: Session) -> T:
         """在指定session中创建记录(外部事务)
 
@@ -21,6 +21,7 @@ from __future__ import annotations
 
 from collections.abc import Generator
 from contextlib import contextmanager
+from contextvars import ContextVar
 from typing import TYPE_CHECKING
 
 from sqlalchemy.orm import Session, scoped_session, sessionmaker
@@ -31,6 +32,9 @@ from .protocols import IConnectionManager, ISessionProvider
 if TYPE_CHECKING:
     pass
 
+# 当前上下文中正在进行的事务: (会话提供者, Session)
+_current_session: ContextVar[tuple[SessionProvider, Session] | None] = ContextVar('xtsqlorm_current_session', default=None)
+
 
 class SessionFactory:
     """Session工厂 - 负责创建Session实例
@@ -81,6 +85,22 @@ class SessionFactory:
         """
         return self._scoped_factory()
 
+    def has_scoped_session(self) -> bool:
+        """当前线程是否已持有ScopedSession
+
+        Returns:
+            bool: 已创建返回True,否则返回False
+        """
+        return self._scoped_factory.registry.has()
+
+    def remove_scoped_session(self) -> None:
+        """关闭并移除当前线程的ScopedSession
+
+        Note:
+            应在请求/任务结束时调用,归还连接并避免Session跨请求复用
+        """
+        self._scoped_factory.remove()
+
 
 class SessionProvider(ISessionProvider):
     """会话提供者 - 统一的事务管理
@@ -108,14 +128,21 @@ class SessionProvider(ISessionProvider):
         ...     session.close()
     """
 
-    def __init__(self, connection_manager: IConnectionManager):
+    def __init__(self, connection_manager: IConnectionManager, share_transaction: bool = False):
         """初始化会话提供者
 
         Args:
             connection_manager: 连接管理器实例
+            share_transaction: 嵌套调用transaction()时是否复用外层事务的Session(以SAVEPOINT隔离),默认False
+
+        Note:
+            开启share_transaction后,嵌套的transaction()不再新建Session和BEGIN/COMMIT,
+            而是在外层Session上执行begin_nested();内层异常只回滚到SAVEPOINT。
+            仓储方法会expunge返回的对象,外层仍需使用的对象请避免在内层重复加载。
         """
         self._connection_manager = connection_manager
         self._session_factory = SessionFactory(connection_manager)
+        self._share_transaction = share_transaction
         mylog.success('SessionProvider | 会话提供者已初始化')
 
     def __str__(self) -> str:
@@ -142,6 +169,42 @@ class SessionProvider(ISessionProvider):
         """
         return self._session_factory.create_session()
 
+    def create_scoped_session(self) -> Session:
+        """获取当前线程的ScopedSession
+
+        同一线程内多次调用返回同一个Session,组合多个操作时可复用
+        同一个Session及其identity map,减少Session创建和连接签出次数。
+
+        Returns:
+            Session: 当前线程的Session对象
+
+        Note:
+            调用者需要在请求结束时调用remove_session()释放
+
+        Example:
+            >>> provider = SessionProvider(connection_manager)
+            >>> session = provider.create_scoped_session()
+            >>> try:
+            ...     user = session.get(User, 1)
+            ...     session.commit()
+            >>> finally:
+            ...     provider.remove_session()
+        """
+        return self._session_factory.create_scoped_session()
+
+    def has_scoped_session(self) -> bool:
+        """当前线程是否已持有ScopedSession
+
+        Returns:
+            bool: 已创建返回True,否则返回False
+        """
+        return self._session_factory.has_scoped_session()
+
+    def remove_session(self) -> None:
+        """关闭并移除当前线程的ScopedSession(请求结束时调用)"""
+        self._session_factory.remove_scoped_session()
+        mylog.debug('SessionProvider | ScopedSession已移除')
+
     @contextmanager
     def transaction(self) -> Generator[Session]:
         """事务上下文管理器(推荐用法)
@@ -180,7 +243,17 @@ class SessionProvider(ISessionProvider):
             ... except ValueError:
             ...     pass  # 事务已自动回滚
         """
+        current = _current_session.get()
+        if self._share_transaction and current is not None and current[0] is self:
+            # 复用外层事务,以SAVEPOINT隔离内层操作
+            session = current[1]
+            with session.begin_nested():
+                mylog.debug('SessionProvider | 复用外层事务(SAVEPOINT)')
+                yield session
+            return
+
         session = self.create_session()
+        token = _current_session.set((self, session))
         try:
             mylog.debug('SessionProvider | 事务开始')
             yield session
@@ -191,6 +264,7 @@ class SessionProvider(ISessionProvider):
             mylog.error(f'SessionProvider | 事务回滚: {e}')
             raise
         finally:
+            _current_session.reset(token)
             session.close()
             mylog.debug('SessionProvider | 会话已关闭')
 
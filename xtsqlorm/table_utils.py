@@ -8,25 +8,37 @@ Github       : https://github.com/sandorn/xtsqlorm
 
 本模块提供数据库表操作的工具函数,包括:
 - reflect_table: 同步反射表结构
+- reflect_tables: 一次批量反射多张表
 - reflect_table_async: 异步反射表结构
 - get_or_create_table_model: 智能获取或创建表模型(支持反射和复制两种模式)
 - generate_model_file: 生成模型文件
+
+reflect_table 支持可选的磁盘反射缓存(cache_dir):将反射得到的表结构pickle到磁盘,
+以information_schema列定义的指纹作为失效依据,跨进程复用,省去每次启动时的多次元数据查询。
 ==============================================================
 """
 
 from __future__ import annotations
 
+import hashlib
+import os
+import pickle  # noqa: S403
 import re
 import subprocess  # noqa: S404
+from collections.abc import Generator
+from contextlib import contextmanager
+from pathlib import Path
 from typing import TYPE_CHECKING, Any, overload
 
-from sqlalchemy import Table, inspect
+from sqlalchemy import MetaData, Table, text
 from xtlog import mylog as log
 
 from .base import BaseModel
 from .cfg import connect_str
 
 if TYPE_CHECKING:
+    from sqlalchemy.engine import Engine
+
     from .engine import ConnectionManager
 
     # 注意: 异步部分暂未完全整合到新架构,保留类型引用
@@ -141,6 +153,65 @@ def execute_command_safely(cmd_args: list[str], mask_credentials: bool = True, e
     return subprocess.run(cmd_args, capture_output=True, text=True, check=False)  # noqa: S603
 
 
+# 表的列定义指纹查询(MySQL),一次查询即可判断磁盘缓存的表结构是否仍然有效
+_SCHEMA_FINGERPRINT_SQL = text(
+    'SELECT COLUMN_NAME, COLUMN_TYPE, IS_NULLABLE, COLUMN_DEFAULT, COLUMN_KEY, EXTRA '
+    'FROM information_schema.columns '
+    'WHERE table_schema = DATABASE() AND table_name = :table_name '
+    'ORDER BY ORDINAL_POSITION'
+)
+
+
+def _schema_fingerprint(engine: Engine, table_name: str) -> str | None:
+    """计算表结构指纹,用于判断磁盘反射缓存是否失效
+
+    仅支持MySQL;其他数据库或表不存在时返回None(即不使用磁盘缓存)。
+    指纹覆盖列名、类型、可空、默认值、键类型等,仅修改索引的DDL需通过refresh=True强制刷新。
+    """
+    if engine.dialect.name != 'mysql':
+        return None
+    with engine.connect() as conn:
+        rows = conn.execute(_SCHEMA_FINGERPRINT_SQL, {'table_name': table_name}).all()
+    if not rows:
+        return None
+    return hashlib.blake2b(repr([tuple(row) for row in rows]).encode(), digest_size=16).hexdigest()
+
+
+def _reflection_cache_file(cache_dir: str | Path, engine: Engine, table_name: str) -> Path:
+    """磁盘反射缓存文件路径: <cache_dir>/<数据库URL摘要>/<表名>.pkl"""
+    url_digest = hashlib.blake2b(engine.url.render_as_string(hide_password=True).encode(), digest_size=8).hexdigest()
+    return Path(cache_dir) / url_digest / f'{table_name}.pkl'
+
+
+def _load_cached_table(cache_file: Path, table_name: str, fingerprint: str) -> Table | None:
+    """读取磁盘缓存的表结构,指纹不一致或文件损坏时返回None"""
+    try:
+        with cache_file.open('rb') as f:
+            cached_fingerprint, cached_metadata = pickle.load(f)  # noqa: S301
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        log.warning(f'reflect_table | 读取反射缓存失败,将重新反射: {e}')
+        return None
+    if cached_fingerprint != fingerprint:
+        return None
+    return cached_metadata.tables.get(table_name)
+
+
+def _store_cached_table(cache_file: Path, table: Table, fingerprint: str) -> None:
+    """将表结构写入磁盘缓存(先写临时文件再原子替换,避免并发进程读到半截文件)"""
+    metadata = MetaData()
+    table.to_metadata(metadata)
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp_file = cache_file.with_suffix(f'.{os.getpid()}.tmp')
+        with tmp_file.open('wb') as f:
+            pickle.dump((fingerprint, metadata), f)
+        os.replace(tmp_file, cache_file)
+    except OSError as e:
+        log.warning(f'reflect_table | 写入反射缓存失败: {e}')
+
+
 # ============ 函数重载签名定义 ============
 @overload
 def get_or_create_table_model(
@@ -148,6 +219,9 @@ def get_or_create_table_model(
     db_conn: ConnectionManager | None = None,
     new_table_name: None = None,
     table_args: None = None,
+    *,
+    refresh: bool = False,
+    cache_dir: str | Path | None = None,
     **conn_kwargs: Any,
 ) -> type[BaseModel]:
     """仅反射现有表模型(new_table_name 为 None)"""
@@ -161,6 +235,8 @@ def get_or_create_table_model(
     *,
     new_table_name: str,
     table_args: dict[str, Any] | None = None,
+    refresh: bool = False,
+    cache_dir: str | Path | None = None,
     **conn_kwargs: Any,
 ) -> type[BaseModel]:
     """复制表结构创建新表模型(new_table_name 为 str)"""
@@ -173,6 +249,9 @@ def get_or_create_table_model(
     db_conn: ConnectionManager | None = None,
     new_table_name: str | None = None,
     table_args: dict[str, Any] | None = None,
+    *,
+    refresh: bool = False,
+    cache_dir: str | Path | None = None,
     **conn_kwargs: Any,
 ) -> type[BaseModel]:
     """
@@ -187,6 +266,8 @@ def get_or_create_table_model(
         db_conn: 数据库连接对象,如果为None则创建新连接
         new_table_name: 新表名。为None时仅反射;提供字符串时复制创建新表
         table_args: 表参数字典,用于修改表结构(仅在复制模式下有效)
+        refresh: 忽略已有的反射结果重新反射(仅在反射模式下有效),默认False
+        cache_dir: 磁盘反射缓存目录(仅在反射模式下有效),详见reflect_table
         **conn_kwargs: 如果没有提供db_conn,这些参数将传递给create_sqlconnection
 
     Returns:
@@ -209,6 +290,11 @@ def get_or_create_table_model(
         >>> # 模式2: 复制并修改表结构
         >>> ModifiedModel = get_or_create_table_model('users', new_table_name='users_v2', table_args={'mysql_engine': 'InnoDB', 'mysql_charset': 'utf8mb4'}, db_key='default')
     """
+    # ========== 模式1: 仅反射现有表 ==========
+    if new_table_name is None:
+        log.info(f'{get_or_create_table_model.__name__} | 模式1: 反射现有表 {source_table_name}')
+        return reflect_table(source_table_name, db_conn, refresh=refresh, cache_dir=cache_dir, **conn_kwargs)
+
     from xtsqlorm.factory import create_connection_manager
 
     # 确保有有效的数据库连接
@@ -216,69 +302,65 @@ def get_or_create_table_model(
         db_conn = create_connection_manager(**conn_kwargs)
     assert db_conn is not None, '数据库连接创建失败,请检查配置文件或连接参数'
 
-    # ========== 模式1: 仅反射现有表 ==========
-    if new_table_name is None:
-        log.info(f'{get_or_create_table_model.__name__} | 模式1: 反射现有表 {source_table_name}')
-        return reflect_table(source_table_name, db_conn)
-
     # ========== 模式2: 复制表结构创建新表 ==========
     log.info(f'{get_or_create_table_model.__name__} | 模式2: 复制表 {source_table_name} -> {new_table_name}')
 
-    # 检查源表是否存在
-    inspector = inspect(db_conn.engine)
-    if not inspector.has_table(source_table_name):
+    # 检查源表是否存在(复用连接管理器的Inspector,共享其info_cache)
+    if not db_conn.inspector.has_table(source_table_name):
         raise ValueError(f'数据库中不存在源表: {source_table_name}')
 
-    # 创建新表前,先确保表不存在(避免索引冲突)
-    from sqlalchemy import MetaData, text
-
-    with db_conn.engine.begin() as conn:
-        conn.execute(text(f'DROP TABLE IF EXISTS `{new_table_name}`'))
-
     # 清理元数据中的旧表信息(如果存在)
     if new_table_name in BaseModel.metadata.tables:
         BaseModel.metadata.remove(BaseModel.metadata.tables[new_table_name])
         log.info(f'get_or_create_table_model | 已清理元数据中的旧表: {new_table_name}')
 
-    # 创建独立的元数据对象来加载源表(避免索引名冲突)
-    temp_metadata = MetaData()
-    source_table = Table(
-        source_table_name,
-        temp_metadata,
-        autoload_with=db_conn.engine,
-    )
-    log.info(f'get_or_create_table_model | 已加载源表结构: {source_table_name}')
-
-    # 复制表结构到BaseModel的元数据中
-    # 注意: SQLAlchemy的to_metadata方法要求schema参数不能为None,如果源表没有schema则省略
-    if source_table.schema is not None:
-        new_table = source_table.to_metadata(
-            BaseModel.metadata,
-            name=new_table_name,
-            schema=source_table.schema,
-        )
-    else:
-        new_table = source_table.to_metadata(
-            BaseModel.metadata,
-            name=new_table_name,
-        )
-
-    # 应用额外的表参数(如果提供)
-    if table_args:
-        for key, value in table_args.items():
-            setattr(new_table, key, value)
-        log.info(f'get_or_create_table_model | 已应用表参数: {table_args}')
-
-    # 创建新表
+    # 删除旧表、加载源表结构、创建新表共用同一个连接和事务
     try:
-        new_table.create(bind=db_conn.engine, checkfirst=False)
+        with db_conn.engine.begin() as conn:
+            # 创建新表前,先确保表不存在(避免索引冲突)
+            conn.execute(text(f'DROP TABLE IF EXISTS `{new_table_name}`'))
+
+            # 创建独立的元数据对象来加载源表(避免索引名冲突)
+            temp_metadata = MetaData()
+            source_table = Table(
+                source_table_name,
+                temp_metadata,
+                autoload_with=conn,
+            )
+            log.info(f'get_or_create_table_model | 已加载源表结构: {source_table_name}')
+
+            # 复制表结构到BaseModel的元数据中
+            # 注意: SQLAlchemy的to_metadata方法要求schema参数不能为None,如果源表没有schema则省略
+            if source_table.schema is not None:
+                new_table = source_table.to_metadata(
+                    BaseModel.metadata,
+                    name=new_table_name,
+                    schema=source_table.schema,
+                )
+            else:
+                new_table = source_table.to_metadata(
+                    BaseModel.metadata,
+                    name=new_table_name,
+                )
+
+            # 应用额外的表参数(如果提供)
+            if table_args:
+                for key, value in table_args.items():
+                    setattr(new_table, key, value)
+                log.info(f'get_or_create_table_model | 已应用表参数: {table_args}')
+
+            # 创建新表
+            new_table.create(bind=conn, checkfirst=False)
         log.success(f'get_or_create_table_model | 成功创建新表: {new_table_name}')
     except Exception as e:
         log.error(f'get_or_create_table_model | 创建表失败: {e}')
-        # 尝试再次清理并重试
+        # 尝试再次清理
         with db_conn.engine.begin() as conn:
             conn.execute(text(f'DROP TABLE IF EXISTS `{new_table_name}`'))
         raise
+    finally:
+        # DDL已执行,Inspector中缓存的表信息可能过期
+        db_conn.inspector.clear_cache()
 
     # 创建模型类
     model_name = new_table_name.title().replace('_', '')
@@ -295,19 +377,67 @@ def get_or_create_table_model(
     return table_model
 
 
+@contextmanager
+def _borrow_connection(db_conn: ConnectionManager | None, conn_kwargs: dict[str, Any]) -> Generator[ConnectionManager]:
+    """提供数据库连接: 优先使用调用方传入的db_conn;否则按conn_kwargs临时创建,用完后释放"""
+    if db_conn is not None:
+        yield db_conn
+        return
+
+    # 延迟导入以避免循环依赖
+    from xtsqlorm.factory import create_connection_manager
+
+    db_conn = create_connection_manager(**conn_kwargs)
+    try:
+        yield db_conn
+    finally:
+        db_conn.dispose()
+
+
+def _load_table(source_table_name: str, db_conn: ConnectionManager, *, refresh: bool, cache_dir: str | Path | None) -> None:
+    """将表结构加载到BaseModel.metadata: 优先读取磁盘反射缓存,否则反射数据库"""
+    fingerprint = cache_file = None
+    if cache_dir is not None:
+        fingerprint = _schema_fingerprint(db_conn.engine, source_table_name)
+        cache_file = _reflection_cache_file(cache_dir, db_conn.engine, source_table_name)
+
+    cached_table = None if refresh or fingerprint is None else _load_cached_table(cache_file, source_table_name, fingerprint)
+    if cached_table is not None:
+        cached_table.to_metadata(BaseModel.metadata)
+        log.info(f'reflect_table | 从磁盘缓存加载表结构: {source_table_name}')
+        return
+
+    # 检查源表是否存在
+    assert db_conn.inspector.has_table(source_table_name), f'数据库中不存在源表: {source_table_name}'
+
+    # 只反射指定的表以提高性能
+    log.info(f'reflect_table | 正在反射数据库表: {source_table_name}')
+    BaseModel.metadata.reflect(bind=db_conn.engine, only=[source_table_name])
+    if fingerprint is not None:
+        _store_cached_table(cache_file, BaseModel.metadata.tables[source_table_name], fingerprint)
+
+
 def reflect_table(
     source_table_name: str,
     db_conn: ConnectionManager | None = None,
+    *,
+    refresh: bool = False,
+    cache_dir: str | Path | None = None,
     **conn_kwargs: Any,
 ) -> type[BaseModel]:
     """
     反射数据库中已存在的表并创建对应的模型类
 
     通过SQLAlchemy的反射机制,动态创建一个与数据库中现有表结构匹配的模型类。
+    同一进程内已反射过的表直接复用BaseModel.metadata中的结果;指定cache_dir时,
+    反射结果还会pickle到磁盘,后续进程在表结构指纹(information_schema列定义,仅MySQL)
+    未变化时直接加载,只需一次指纹查询。
 
     Args:
         source_table_name: 数据库中已存在的表名
         db_conn: 数据库连接对象,如果为None则创建新连接
+        refresh: 是否忽略进程内及磁盘缓存,强制重新反射,默认False
+        cache_dir: 磁盘反射缓存目录(如 Path.home() / '.cache' / 'xtsqlorm'),None表示不使用磁盘缓存
         **conn_kwargs: 如果没有提供db_conn,这些参数将传递给create_sqlconnection
 
     Returns:
@@ -317,39 +447,86 @@ def reflect_table(
         ValueError: 当表名不存在或连接无效时
         SQLAlchemyError: 当反射过程中发生SQL错误时
         Exception: 当发生其他意外错误时
+
+    Example:
+        >>> user_model = reflect_table('users', db_key='default', cache_dir=Path.home() / '.cache' / 'xtsqlorm')
+        >>> # 表结构变更后强制刷新
+        >>> user_model = reflect_table('users', db_key='default', cache_dir=Path.home() / '.cache' / 'xtsqlorm', refresh=True)
     """
-    # 延迟导入以避免循环依赖
-    from xtsqlorm.factory import create_connection_manager
+    if refresh and source_table_name in BaseModel.metadata.tables:
+        BaseModel.metadata.remove(BaseModel.metadata.tables[source_table_name])
 
-    # 确保有有效的数据库连接
-    if db_conn is None:
-        db_conn = create_connection_manager(**conn_kwargs)
-    assert db_conn is not None, '数据库连接创建失败,请检查配置文件或连接参数'
+    # 表已在进程内反射过时直接复用,无需创建数据库连接
+    if source_table_name not in BaseModel.metadata.tables:
+        with _borrow_connection(db_conn, conn_kwargs) as db_conn:
+            _load_table(source_table_name, db_conn, refresh=refresh, cache_dir=cache_dir)
 
-    # 检查源表是否存在
-    inspector = inspect(db_conn.engine)
-    assert inspector.has_table(source_table_name), f'数据库中不存在源表: {source_table_name}'
+    # 获取源表对象并创建模型类
+    table_model = _create_table_model(BaseModel.metadata.tables[source_table_name])
+    log.success(f'reflect_table | 成功反射表: {source_table_name},创建模型类: {table_model.__name__}')
 
-    # 只反射指定的表以提高性能
-    log.info(f'reflect_table | 正在反射数据库表: {source_table_name}')
-    BaseModel.metadata.reflect(bind=db_conn.engine, only=[source_table_name])
+    return table_model
 
-    # 获取源表对象
-    source_table = BaseModel.metadata.tables[source_table_name]
 
-    # 创建模型类,继承自BaseModel
-    model_name = source_table_name.title().replace('_', '')
-    table_model = type(
-        model_name,
+def reflect_tables(
+    table_names: list[str],
+    db_conn: ConnectionManager | None = None,
+    *,
+    refresh: bool = False,
+    **conn_kwargs: Any,
+) -> dict[str, type[BaseModel]]:
+    """
+    一次批量反射多张表并创建对应的模型类
+
+    所有尚未反射的表通过一次MetaData.reflect(only=...)完成反射,SQLAlchemy 2.x会按表批量
+    查询列、主键、外键和索引,比逐表调用reflect_table少得多的元数据查询。
+    反射结果保存在BaseModel.metadata中,之后对这些表调用reflect_table或
+    get_or_create_table_model(反射模式)将直接复用,不再访问数据库。
+
+    Args:
+        table_names: 数据库中已存在的表名列表
+        db_conn: 数据库连接对象,如果为None则创建新连接
+        refresh: 是否忽略已有的反射结果,强制重新反射,默认False
+        **conn_kwargs: 如果没有提供db_conn,这些参数将传递给create_connection_manager
+
+    Returns:
+        dict[str, type[BaseModel]]: {表名: 模型类},顺序与table_names一致
+
+    Raises:
+        InvalidRequestError: 当部分表在数据库中不存在时
+        SQLAlchemyError: 当反射过程中发生SQL错误时
+
+    Example:
+        >>> models = reflect_tables(['users', 'orders'], db_key='default')
+        >>> UserModel, OrderModel = models['users'], models['orders']
+    """
+    if refresh:
+        for name in table_names:
+            if name in BaseModel.metadata.tables:
+                BaseModel.metadata.remove(BaseModel.metadata.tables[name])
+
+    # 只反射尚未加载的表,一次调用完成
+    missing = [name for name in table_names if name not in BaseModel.metadata.tables]
+    if missing:
+        log.info(f'reflect_tables | 正在批量反射数据库表: {missing}')
+        with _borrow_connection(db_conn, conn_kwargs) as db_conn:
+            BaseModel.metadata.reflect(bind=db_conn.engine, only=missing, views=False)
+
+    models = {name: _create_table_model(BaseModel.metadata.tables[name]) for name in table_names}
+    log.success(f'reflect_tables | 成功反射 {len(models)} 张表: {list(models)}')
+    return models
+
+
+def _create_table_model(table: Table) -> type[BaseModel]:
+    """为已加载的表对象创建继承自BaseModel的模型类(类名为表名的驼峰形式)"""
+    return type(
+        table.name.title().replace('_', ''),
         (BaseModel,),
         {
-            '__table__': source_table,
-            '__tablename__': source_table_name,
+            '__table__': table,
+            '__tablename__': table.name,
         },
     )
-    log.success(f'reflect_table | 成功反射表: {source_table_name},创建模型类: {model_name}')
-
-    return table_model
 
 
 async def reflect_table_async(
@@ -499,4 +676,5 @@ __all__ = [
     'get_or_create_table_model',
     'reflect_table',
     'reflect_table_async',
+    'reflect_tables',
 ]
@@ -34,6 +34,7 @@ class JsonEncodedDict(TypeDecorator):
     """
 
     impl = TEXT
+    cache_ok = True
 
     def process_bind_param(self, value: Any, dialect: Any) -> str | None:
         """在将值存储到数据库前,将Python对象转换为JSON字符串
@@ -70,6 +71,7 @@ class EnumType(TypeDecorator):
     """
 
     impl = TEXT
+    cache_ok = True
 
     def __init__(self, enum_class: type[Enum], *args: Any, **kwargs: Any) -> None:
         """初始化枚举类型装饰器
@@ -81,20 +83,29 @@ class EnumType(TypeDecorator):
         """
         super().__init__(*args, **kwargs)
         self.enum_class = enum_class
+        # 预先冻结合法值集合,校验原始值时为O(1)查找
+        self._values = frozenset(str(member.value) for member in enum_class)
 
-    def process_bind_param(self, value: Enum | None, dialect: Any) -> str | None:
+    def process_bind_param(self, value: Enum | str | None, dialect: Any) -> str | None:
         """在存储到数据库前,将枚举转换为字符串
 
         Args:
-            value: 枚举值
+            value: 枚举值或其字符串值
             dialect: SQLAlchemy方言对象(未使用)
 
         Returns:
             str | None: 枚举的字符串表示,None值保持不变
+
+        Raises:
+            ValueError: 传入的字符串不是枚举的合法值
         """
         if value is None:
             return None
-        return value.value if hasattr(value, 'value') else str(value)
+        if isinstance(value, Enum):
+            return value.value
+        if str(value) not in self._values:
+            raise ValueError(f'{value!r} 不是 {self.enum_class.__name__} 的合法值: {sorted(self._values)}')
+        return str(value)
 
     def process_result_value(self, value: str | None, dialect: Any) -> Enum | None:
         """从数据库检索时,将字符串转换回枚举
@@ -125,6 +136,7 @@ class UTCDateTime(TypeDecorator):
     """
 
     impl = TEXT
+    cache_ok = True
 
     def process_bind_param(self, value: Any, dialect: Any) -> str | None:
         """在存储到数据库前,确保时间为UTC格式字符串
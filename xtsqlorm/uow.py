@@ -8,6 +8,7 @@ Github       : https://github.com/sandorn/xtsqlorm
 
 本模块提供工作单元模式实现:
 - UnitOfWork: 工作单元,管理一组相关操作的事务边界
+- BatchLoader: 批量加载器,将多次按ID查询合并为一条IN查询
 
 适用场景:
 - 需要在一个事务中操作多个表
@@ -18,6 +19,7 @@ Github       : https://github.com/sandorn/xtsqlorm
 
 from __future__ import annotations
 
+from collections.abc import Iterable
 from contextlib import contextmanager
 from typing import TYPE_CHECKING
 
@@ -30,6 +32,113 @@ if TYPE_CHECKING:
     from sqlalchemy.orm import Session
 
 
+class _UoWSessionProvider(ISessionProvider):
+    """工作单元内部的Session提供者
+
+    确保所有仓储操作都使用同一个session,每个工作单元只创建一次
+    """
+
+    def __init__(self, session: Session):
+        self._session = session
+
+    def create_session(self) -> Session:
+        return self._session
+
+    @contextmanager
+    def transaction(self):
+        # UoW内部不创建新事务,直接使用当前session
+        yield self._session
+
+
+class BatchLoader[T]:
+    """批量加载器 - 合并按ID查询,解决N+1问题
+
+    参考DataLoader模式:先登记需要的ID,在首次取值时用一条
+    WHERE id IN (...) 查询一次性加载全部待加载记录,结果按ID缓存。
+
+    Type Parameters:
+        T: ORM模型类型
+
+    Example:
+        >>> with UnitOfWork(provider) as uow:
+        ...     loader = uow.batch(User)
+        ...     loader.add_many(order.user_id for order in orders)
+        ...     for order in orders:
+        ...         user = loader.load(order.user_id)  # 只执行一次IN查询
+    """
+
+    __slots__ = ('_loaded', '_pending', '_repository', '_session')
+
+    def __init__(self, repository: Repository[T], session: Session):
+        """初始化批量加载器
+
+        Args:
+            repository: 模型对应的仓储实例
+            session: 当前工作单元的session
+        """
+        self._repository = repository
+        self._session = session
+        self._pending: set[int] = set()
+        self._loaded: dict[int, T | None] = {}
+
+    def add(self, id_value: int) -> None:
+        """登记待加载的ID
+
+        Args:
+            id_value: 记录ID
+        """
+        if id_value not in self._loaded:
+            self._pending.add(id_value)
+
+    def add_many(self, ids: Iterable[int]) -> None:
+        """批量登记待加载的ID
+
+        Args:
+            ids: 记录ID序列
+        """
+        for id_value in ids:
+            self.add(id_value)
+
+    def dispatch(self) -> None:
+        """执行一次IN查询,加载所有已登记的ID"""
+        if not self._pending:
+            return
+        ids = list(self._pending)
+        self._pending.clear()
+        instances = self._repository.get_many_by_ids_in_session(ids, self._session)
+        self._loaded.update(dict.fromkeys(ids))
+        self._loaded.update({instance.id: instance for instance in instances})  # type: ignore[attr-defined]
+        log.debug(f'BatchLoader | 批量加载 {len(ids)} 个ID,命中 {len(instances)} 条')
+
+    def load(self, id_value: int) -> T | None:
+        """获取指定ID的记录,必要时先批量加载所有已登记的ID
+
+        Args:
+            id_value: 记录ID
+
+        Returns:
+            T | None: 查询到的模型对象,不存在则返回None
+        """
+        if id_value not in self._loaded:
+            self.add(id_value)
+            self.dispatch()
+        return self._loaded[id_value]
+
+    def load_many(self, ids: Iterable[int]) -> list[T | None]:
+        """获取多个ID的记录(单次IN查询)
+
+        Args:
+            ids: 记录ID序列
+
+        Returns:
+            list[T | None]: 与ids顺序一致的模型对象列表,不存在的位置为None
+        """
+        ids = list(ids)
+        self.add_many(ids)
+        self.dispatch()
+        return [self._loaded[id_value] for id_value in ids]
+
+
 class UnitOfWork:
     """工作单元 - 管理一组相关操作的事务边界
 
@@ -68,6 +177,9 @@ class UnitOfWork:
         ...     pass  # 所有操作已自动回滚
     """
 
+    # 工作单元常为短生命周期对象,使用__slots__省去实例__dict__
+    __slots__ = ('_loaders', '_provider', '_repositories', '_session', '_session_provider')
+
     def __init__(self, session_provider: ISessionProvider):
         """初始化工作单元
 
@@ -76,7 +188,9 @@ class UnitOfWork:
         """
         self._session_provider = session_provider
         self._session: Session | None = None
+        self._provider: _UoWSessionProvider | None = None
         self._repositories: dict[type, Repository] = {}
+        self._loaders: dict[type, BatchLoader] = {}
         log.debug('UnitOfWork | 工作单元已创建')
 
     def __enter__(self) -> UnitOfWork:
@@ -86,6 +200,7 @@ class UnitOfWork:
             UnitOfWork: 工作单元实例
         """
         self._session = self._session_provider.create_session()
+        self._provider = _UoWSessionProvider(self._session)
         log.info('UnitOfWork | 工作单元事务开始')
         return self
 
@@ -155,27 +270,11 @@ class UnitOfWork:
         if model in self._repositories:
             return self._repositories[model]
 
-        # 创建一个临时的session_provider,返回当前UoW的session
-        class _UoWSessionProvider(ISessionProvider):
-            """工作单元内部的Session提供者
-
-            这个内部类确保所有仓储操作都使用同一个session
-            """
-
-            def __init__(self, session: Session):
-                self._session = session
-
-            def create_session(self) -> Session:
-                return self._session
-
-            @contextmanager
-            def transaction(self):
-                # UoW内部不创建新事务,直接使用当前session
-                yield self._session
+        if self._provider is None:
+            raise RuntimeError('UnitOfWork未启动,请在with语句中使用')
 
         # 创建仓储实例
-        provider = _UoWSessionProvider(self.session)
-        repo = Repository(model, provider)
+        repo = Repository(model, self._provider)
 
         # 缓存仓储实例
         self._repositories[model] = repo
@@ -183,6 +282,25 @@ class UnitOfWork:
         log.debug(f'UnitOfWork | 创建仓储: {model.__name__}')
         return repo
 
+    def batch[T](self, model: type[T]) -> BatchLoader[T]:
+        """获取指定模型的批量加载器
+
+        批量加载器使用当前工作单元的session,同一模型在同一工作单元中只创建一次。
+
+        Args:
+            model: ORM模型类
+
+        Returns:
+            BatchLoader[T]: 模型对应的批量加载器
+
+        Example:
+            >>> with UnitOfWork(provider) as uow:
+            ...     users = uow.batch(User).load_many([1, 2, 3])  # 一条IN查询
+        """
+        if model not in self._loaders:
+            self._loaders[model] = BatchLoader(self.repository(model), self.session)
+        return self._loaders[model]
+
     def commit(self):
         """显式提交事务
 
@@ -218,4 +336,4 @@ class UnitOfWork:
             log.warning('UnitOfWork | 手动回滚事务')
 
 
-__all__ = ['UnitOfWork']
+__all__ = ['BatchLoader', 'UnitOfWork']
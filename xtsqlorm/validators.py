@@ -19,14 +19,65 @@ Github       : https://github.com/sandorn/xtsqlorm
 
 from __future__ import annotations
 
+import ipaddress
 import json
 import re
 from collections.abc import Sequence
 from datetime import datetime
 from enum import Enum
+from functools import lru_cache
+from operator import mul
 from typing import Any
 from urllib.parse import urlparse
 
+# 预编译的正则表达式,模块加载时编译一次
+# 简单的邮箱格式验证
+_EMAIL_RE = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+# 中国大陆手机号验证(1开头,11位数字)
+_PHONE_RE = re.compile(r'^1[3-9]\d{9}$')
+_USERNAME_RE = re.compile(r'^[a-zA-Z0-9]+$')
+_USERNAME_SPECIAL_RE = re.compile(r'^[a-zA-Z0-9._-]+$')
+# 18位身份证号码格式验证及校验码加权因子
+_ID_CARD_RE = re.compile(r'^\d{17}[\dXx]$')
+_ID_CARD_FACTORS = (7, 9, 10, 5, 8, 4, 2, 1, 6, 3, 7, 9, 10, 5, 8, 4, 2)
+_ID_CARD_CHECK_CODES = '10X98765432'
+
+
+# 密码字符类别扫描使用的位标记
+_HAS_DIGIT = 1
+_HAS_UPPER = 2
+_HAS_LOWER = 4
+_HAS_SPECIAL = 8
+_SPECIAL_CHARS = frozenset('!@#$%^&*(),.?":{}|<>')
+
+
+def _scan_char_classes(value: str, wanted: int) -> int:
+    """单次遍历字符串,返回出现过的字符类别位掩码
+
+    wanted 中的类别全部出现后提前结束遍历。
+    """
+    flags = 0
+    for c in value:
+        if c.isdigit():
+            flags |= _HAS_DIGIT
+        elif c.isupper():
+            flags |= _HAS_UPPER
+        elif c.islower():
+            flags |= _HAS_LOWER
+        elif c in _SPECIAL_CHARS:
+            flags |= _HAS_SPECIAL
+        else:
+            continue
+        if flags & wanted == wanted:
+            break
+    return flags
+
+
+@lru_cache(maxsize=256)
+def _compile_pattern(pattern: str) -> re.Pattern[str]:
+    """编译并缓存用户自定义的正则表达式模式"""
+    return re.compile(pattern)
+
 
 class ValidationError(Exception):
     """验证错误异常类
@@ -88,9 +139,7 @@ def validate_email(email: str, field: str | None = None) -> str:
     if not email:
         raise ValidationError('邮箱地址不能为空', field, email)
 
-    # 简单的邮箱格式验证
-    pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-    if not re.match(pattern, email):
+    if not _EMAIL_RE.match(email):
         raise ValidationError('邮箱格式无效', field, email)
 
     return email
@@ -112,9 +161,7 @@ def validate_phone(phone: str, field: str | None = None) -> str:
     if not phone:
         raise ValidationError('手机号不能为空', field, phone)
 
-    # 中国大陆手机号验证(1开头,11位数字)
-    pattern = r'^1[3-9]\d{9}$'
-    if not re.match(pattern, phone):
+    if not _PHONE_RE.match(phone):
         raise ValidationError('手机号格式无效', field, phone)
 
     return phone
@@ -137,8 +184,8 @@ def validate_datetime(dt_str: str, field: str | None = None) -> datetime:
         raise ValidationError('日期时间不能为空', field, dt_str)
 
     try:
-        # 尝试解析ISO格式日期时间
-        return datetime.fromisoformat(dt_str.replace('Z', '+00:00'))
+        # 解析ISO 8601格式日期时间(Python 3.11+ 原生支持 'Z' 后缀)
+        return datetime.fromisoformat(dt_str)
     except (ValueError, TypeError) as e:
         raise ValidationError('日期时间格式无效', field, dt_str) from e
 
@@ -312,6 +359,29 @@ def validate_url(url: str, field: str | None = None, *, require_https: bool = Fa
     return url
 
 
+def _is_ipv4(ip: str) -> bool:
+    """按点分十进制拆分校验IPv4,不使用正则"""
+    parts = ip.split('.')
+    if len(parts) != 4:
+        return False
+    word = 0
+    for part in parts:
+        if not (0 < len(part) <= 3 and part.isascii() and part.isdigit()):
+            return False
+        word |= int(part)
+    # 任一段超过255都会在低8位之外留下置位
+    return not word & ~0xFF
+
+
+def _is_ipv6(ip: str) -> bool:
+    """使用标准库ipaddress校验IPv6"""
+    try:
+        ipaddress.IPv6Address(ip)
+    except ValueError:
+        return False
+    return True
+
+
 def validate_ip(ip: str, field: str | None = None, *, version: int | None = None) -> str:
     """验证IP地址格式
 
@@ -335,13 +405,8 @@ def validate_ip(ip: str, field: str | None = None, *, version: int | None = None
     if not ip:
         raise ValidationError('IP地址不能为空', field, ip)
 
-    # IPv4 验证
-    ipv4_pattern = r'^((25[0-5]|2[0-4][0-9]|[01]?[0-9][0-9]?)\.){3}(25[0-5]|2[0-4][0-9]|[01]?[0-9][0-9]?)$'
-    # IPv6 验证(简化版)
-    ipv6_pattern = r'^(([0-9a-fA-F]{1,4}:){7}[0-9a-fA-F]{1,4}|([0-9a-fA-F]{1,4}:){1,7}:|([0-9a-fA-F]{1,4}:){1,6}:[0-9a-fA-F]{1,4}|([0-9a-fA-F]{1,4}:){1,5}(:[0-9a-fA-F]{1,4}){1,2}|([0-9a-fA-F]{1,4}:){1,4}(:[0-9a-fA-F]{1,4}){1,3}|([0-9a-fA-F]{1,4}:){1,3}(:[0-9a-fA-F]{1,4}){1,4}|([0-9a-fA-F]{1,4}:){1,2}(:[0-9a-fA-F]{1,4}){1,5}|[0-9a-fA-F]{1,4}:((:[0-9a-fA-F]{1,4}){1,6})|:((:[0-9a-fA-F]{1,4}){1,7}|:))$'
-
-    is_ipv4 = bool(re.match(ipv4_pattern, ip))
-    is_ipv6 = bool(re.match(ipv6_pattern, ip))
+    is_ipv4 = _is_ipv4(ip)
+    is_ipv6 = version != 4 and not is_ipv4 and _is_ipv6(ip)
 
     if version == 4 and not is_ipv4:
         raise ValidationError('不是有效的IPv4地址', field, ip)
@@ -355,6 +420,43 @@ def validate_ip(ip: str, field: str | None = None, *, version: int | None = None
     return ip
 
 
+def validate_ips(ips: Sequence[str], field: str | None = None, *, version: int | None = None) -> list[str]:
+    """批量验证IP地址列表
+
+    一次调用完成整个列表的校验,避免在调用方逐个调用 validate_ip。
+    失败时在错误消息中给出出错元素的下标。
+
+    Args:
+        ips: 要验证的IP地址列表
+        field: 字段名(用于错误消息)
+        version: IP版本(4或6,None表示都接受)
+
+    Returns:
+        list[str]: 验证通过的IP地址列表
+
+    Raises:
+        ValidationError: 如果任一IP格式无效
+
+    Example:
+        >>> validate_ips(['192.168.1.1', '10.0.0.1'], version=4)
+        ['192.168.1.1', '10.0.0.1']
+        >>> validate_ips(['192.168.1.1', '300.0.0.1'], 'ip_whitelist', version=4)
+        ValidationError: 字段 'ip_whitelist' 验证失败: 第2项: 不是有效的IPv4地址
+    """
+    check = _is_ipv4 if version == 4 else _is_ipv6 if version == 6 else None
+    for index, ip in enumerate(ips, 1):
+        valid = bool(ip) and (check(ip) if check else _is_ipv4(ip) or _is_ipv6(ip))
+        if not valid:
+            if version == 4:
+                msg = '不是有效的IPv4地址'
+            elif version == 6:
+                msg = '不是有效的IPv6地址'
+            else:
+                msg = 'IP地址格式无效'
+            raise ValidationError(f'第{index}项: {msg}', field, ip)
+    return list(ips)
+
+
 def validate_pattern(value: str, pattern: str, field: str | None = None, *, error_message: str | None = None) -> str:
     """使用自定义正则表达式验证字符串
 
@@ -379,7 +481,7 @@ def validate_pattern(value: str, pattern: str, field: str | None = None, *, erro
     if not value:
         raise ValidationError('值不能为空', field, value)
 
-    if not re.match(pattern, value):
+    if not _compile_pattern(pattern).match(value):
         msg = error_message or '格式不匹配指定模式'
         raise ValidationError(msg, field, value)
 
@@ -482,16 +584,19 @@ def validate_password_strength(
     if len(password) < min_length:
         errors.append(f'密码长度至少为{min_length}个字符')
 
-    if require_digit and not any(c.isdigit() for c in password):
+    wanted = (_HAS_DIGIT if require_digit else 0) | (_HAS_UPPER if require_upper else 0) | (_HAS_LOWER if require_lower else 0) | (_HAS_SPECIAL if require_special else 0)
+    flags = _scan_char_classes(password, wanted)
+
+    if require_digit and not flags & _HAS_DIGIT:
         errors.append('密码必须包含至少一个数字')
 
-    if require_upper and not any(c.isupper() for c in password):
+    if require_upper and not flags & _HAS_UPPER:
         errors.append('密码必须包含至少一个大写字母')
 
-    if require_lower and not any(c.islower() for c in password):
+    if require_lower and not flags & _HAS_LOWER:
         errors.append('密码必须包含至少一个小写字母')
 
-    if require_special and not re.search(r'[!@#$%^&*(),.?":{}|<>]', password):
+    if require_special and not flags & _HAS_SPECIAL:
         errors.append('密码必须包含至少一个特殊字符')
 
     if errors:
@@ -536,13 +641,13 @@ def validate_username(
         raise ValidationError(f'用户名长度必须在{min_length}到{max_length}个字符之间', field, username)
 
     if allow_special:
-        pattern = r'^[a-zA-Z0-9._-]+$'
+        pattern = _USERNAME_SPECIAL_RE
         error_msg = '用户名只能包含字母、数字和特殊字符(._-)'
     else:
-        pattern = r'^[a-zA-Z0-9]+$'
+        pattern = _USERNAME_RE
         error_msg = '用户名只能包含字母和数字'
 
-    if not re.match(pattern, username):
+    if not pattern.match(username):
         raise ValidationError(error_msg, field, username)
 
     return username
@@ -569,17 +674,13 @@ def validate_chinese_id_card(id_card: str, field: str | None = None) -> str:
         raise ValidationError('身份证号码不能为空', field, id_card)
 
     # 18位身份证号码格式验证
-    pattern = r'^\d{17}[\dXx]$'
-    if not re.match(pattern, id_card):
+    if not _ID_CARD_RE.match(id_card):
         raise ValidationError('身份证号码格式无效(应为18位)', field, id_card)
 
     # 校验码验证
-    factors = [7, 9, 10, 5, 8, 4, 2, 1, 6, 3, 7, 9, 10, 5, 8, 4, 2]
-    check_codes = '10X98765432'
-
     try:
-        sum_value = sum(int(id_card[i]) * factors[i] for i in range(17))
-        check_code = check_codes[sum_value % 11]
+        sum_value = sum(map(mul, map(int, id_card[:17]), _ID_CARD_FACTORS))
+        check_code = _ID_CARD_CHECK_CODES[sum_value % 11]
 
         if id_card[17].upper() != check_code:
             raise ValidationError('身份证号码校验码无效', field, id_card)
@@ -599,6 +700,7 @@ __all__ = [
     'validate_enum',
     'validate_in_choices',
     'validate_ip',
+    'validate_ips',
     'validate_json',
     'validate_length',
     'validate_password_strength',